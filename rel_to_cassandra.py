@@ -15,57 +15,176 @@ Usage:
 
 import json
 import argparse
+import hashlib
+import logging
 import re
 import os
-from collections import defaultdict
+import sys
+from collections import defaultdict, Counter
+from functools import lru_cache
+from itertools import combinations
+
+# Use orjson for faster schema parsing when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# SQL-parsing patterns used when analyzing query access patterns.
+# SQL_TOKEN_RE finds FROM/JOIN tables and the WHERE/ORDER BY keywords in one
+# scan; WHERE_RE and ORDER_RE are then matched at the keyword positions.
+SQL_TOKEN_RE = re.compile(
+    r'(?P<kw>from|join)\s+(?P<table>[a-zA-Z0-9_]+)|(?P<where>where)(?=\s)|(?P<order>order by)(?=\s)',
+    re.IGNORECASE
+)
+# Cheaper variant for queries without WHERE or ORDER BY clauses
+TABLE_TOKEN_RE = re.compile(r'(?P<kw>from|join)\s+(?P<table>[a-zA-Z0-9_]+)', re.IGNORECASE)
+WHERE_RE = re.compile(r'where\s+(.*?)(?:order by|group by|limit|$)', re.IGNORECASE | re.DOTALL)
+CONDITION_RE = re.compile(r'([a-zA-Z0-9_.]+)\s*(?:=|>|<|>=|<=|!=|LIKE|IN)\s*')
+ORDER_RE = re.compile(r'order by\s+(.*?)(?:limit|$)', re.IGNORECASE | re.DOTALL)
+
+# Mapping of common SQL types to Cassandra types
+TYPE_MAP = {
+    'int': 'int',
+    'integer': 'int',
+    'smallint': 'smallint',
+    'bigint': 'bigint',
+    'tinyint': 'tinyint',
+    'varchar': 'text',
+    'char': 'text',
+    'text': 'text',
+    'string': 'text',
+    'float': 'float',
+    'double': 'double',
+    'decimal': 'decimal',
+    'boolean': 'boolean',
+    'bool': 'boolean',
+    'date': 'date',
+    'time': 'time',
+    'timestamp': 'timestamp',
+    'datetime': 'timestamp',
+    'uuid': 'uuid',
+    'blob': 'blob'
+}
+
+@lru_cache(maxsize=256)
+def map_data_type(relational_type):
+    """
+    Map a relational data type to a Cassandra data type.
+    Results are cached, so unknown types are only reported once.
+    """
+    relational_type = relational_type.lower()
+    
+    # Handle types with length specifications like varchar(255)
+    base_type = relational_type.split('(', 1)[0]
+    
+    if base_type in TYPE_MAP:
+        return TYPE_MAP[base_type]
+    else:
+        logger.warning("Warning: Unknown data type '%s', defaulting to 'text'", relational_type)
+        return 'text'
+
+# Output files are written through a 1 MiB buffer to keep write syscalls down
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Converted tables are cached on disk, keyed by a hash of the input files.
+# Bump CACHE_VERSION whenever the conversion logic changes its output.
+CACHE_DIR = '.rel2c_cache'
+CACHE_VERSION = '1'
+
+# Fixed sections of the generated CQL script
+CQL_HEADER = """-- Cassandra Schema Generated from Relational Model
+-- Generated by Relational to Cassandra Converter
+
+-- Create keyspace (adjust replication strategy as needed)
+CREATE KEYSPACE IF NOT EXISTS converted_schema WITH REPLICATION = {
+    'class': 'SimpleStrategy',
+    'replication_factor': 3
+};
+
+USE converted_schema;
+"""
+
+CQL_FOOTER = """-- Notes on Cassandra Data Model:
+-- 1. Tables are designed to optimize for specific query patterns
+-- 2. Data is denormalized - the same data may exist in multiple tables
+-- 3. Updates must be performed on all tables containing the data
+-- 4. Always query by partition key for best performance"""
 
 class RelationalToCassandraConverter:
     def __init__(self):
         self.relational_tables = {}
-        self.foreign_keys = defaultdict(list)
-        self.relationships = defaultdict(list)
+        self.foreign_keys = {}
+        self.relationships = {}
+        self.related_tables = {}
+        self.fk_targets = {}
         self.access_patterns = []
+        self.patterns_by_table = defaultdict(list)
         self.cassandra_tables = {}
         
     def load_schema(self, schema_file):
         """Load relational schema from JSON file."""
         try:
-            with open(schema_file, 'r') as f:
-                schema_data = json.load(f)
+            with open(schema_file, 'rb') as f:
+                schema_data = json_loads(f.read())
                 
-            # Extract tables, columns, primary keys, and foreign keys
+            # Foreign keys are collected as (table, column, ref_table, ref_column) edges
+            fk_edges = []
+            
+            # Extract tables, columns, primary keys, and foreign keys.
+            # Names are interned since they are compared and hashed throughout the analysis.
             for table_info in schema_data.get('tables', []):
-                table_name = table_info['name']
+                table_name = sys.intern(table_info['name'])
+                columns = {}
+                primary_key = []
                 self.relational_tables[table_name] = {
-                    'columns': {},
-                    'primary_key': []
+                    'columns': columns,
+                    'primary_key': primary_key
                 }
                 
-                # Process columns
+                # Process columns; names are lowercased once here since Cassandra
+                # identifiers are case-insensitive unless quoted
                 for column in table_info.get('columns', []):
-                    col_name = column['name']
-                    self.relational_tables[table_name]['columns'][col_name] = {
-                        'type': self._map_data_type(column['type']),
+                    col_name = sys.intern(column['name'].lower())
+                    columns[col_name] = {
+                        'type': map_data_type(column['type']),
                         'nullable': column.get('nullable', True)
                     }
                     
-                    if column.get('primary_key', False):
-                        self.relational_tables[table_name]['primary_key'].append(col_name)
+                    if column.get('primary_key'):
+                        primary_key.append(col_name)
                 
                 # Process foreign keys
                 for fk in table_info.get('foreign_keys', []):
                     reference = fk.get('references', {})
-                    self.foreign_keys[table_name].append({
-                        'column': fk['column'],
-                        'references_table': reference.get('table'),
-                        'references_column': reference.get('column')
-                    })
-                    
-                    # Track relationships for denormalization
                     ref_table = reference.get('table')
-                    if ref_table:
-                        self.relationships[table_name].append(ref_table)
-                        self.relationships[ref_table].append(table_name)
+                    ref_column = reference.get('column')
+                    fk_edges.append((
+                        table_name,
+                        sys.intern(fk['column'].lower()),
+                        sys.intern(ref_table) if ref_table else ref_table,
+                        sys.intern(ref_column.lower()) if ref_column else ref_column
+                    ))
+            
+            # Group foreign keys by table in a single pass over the edges
+            for table_name, column, ref_table, ref_column in fk_edges:
+                self.foreign_keys.setdefault(table_name, []).append({
+                    'column': column,
+                    'references_table': ref_table,
+                    'references_column': ref_column
+                })
+                
+                # Track relationships for denormalization
+                if ref_table:
+                    self.relationships.setdefault(table_name, []).append(ref_table)
+                    self.relationships.setdefault(ref_table, []).append(table_name)
+            
+            # Set-based lookups for relationship and parent-table membership checks
+            self.related_tables = {table: set(related) for table, related in self.relationships.items()}
+            self.fk_targets = {table: {fk['references_table'] for fk in fks} for table, fks in self.foreign_keys.items()}
             
             print(f"Loaded schema with {len(self.relational_tables)} tables")
             return True
@@ -84,112 +203,81 @@ class RelationalToCassandraConverter:
             
         try:
             with open(queries_file, 'r') as f:
-                query_lines = f.readlines()
+                # Skip blank lines and comments up front
+                queries = [q for q in (line.strip() for line in f.read().splitlines())
+                           if q and not q.startswith('#')]
+
+            # Extract tables, conditions and ordering from each query
+            for query in queries:
+                tables, conditions, ordering = self._parse_query(query)
+                pattern = {
+                    'tables': tables,
+                    'conditions': conditions,
+                    'ordering': ordering
+                }
+                self.access_patterns.append(pattern)
                 
-            for line in query_lines:
-                query = line.strip()
-                if query and not query.startswith('#'):
-                    # Extract tables and conditions from the query
-                    tables = self._extract_tables_from_query(query)
-                    conditions = self._extract_conditions_from_query(query)
-                    ordering = self._extract_ordering_from_query(query)
-                    
-                    self.access_patterns.append({
-                        'tables': tables,
-                        'conditions': conditions,
-                        'ordering': ordering
-                    })
+                # Index the pattern under each table it touches
+                for table in set(tables):
+                    self.patterns_by_table[table].append(pattern)
             
             print(f"Loaded {len(self.access_patterns)} query patterns for analysis")
         except Exception as e:
             print(f"Error loading queries: {e}")
     
-    def _extract_tables_from_query(self, query):
-        """Extract table names from a SQL query."""
-        # Simple regex to find tables in FROM and JOIN clauses
-        from_pattern = re.compile(r'from\s+([a-zA-Z0-9_]+)', re.IGNORECASE)
-        join_pattern = re.compile(r'join\s+([a-zA-Z0-9_]+)', re.IGNORECASE)
-        
-        tables = []
-        from_matches = from_pattern.findall(query)
-        join_matches = join_pattern.findall(query)
-        
-        if from_matches:
-            tables.extend(from_matches)
-        if join_matches:
-            tables.extend(join_matches)
-            
-        return tables
-    
-    def _extract_conditions_from_query(self, query):
-        """Extract WHERE conditions from a SQL query."""
-        # Simple regex to find conditions in WHERE clause
-        where_pattern = re.compile(r'where\s+(.*?)(?:order by|group by|limit|$)', re.IGNORECASE | re.DOTALL)
-        condition_pattern = re.compile(r'([a-zA-Z0-9_.]+)\s*(?:=|>|<|>=|<=|!=|LIKE|IN)\s*')
+    def _parse_query(self, query):
+        """
+        Extract tables, WHERE condition columns and ORDER BY columns from a SQL query.
+        The query is tokenized in a single scan; clause bodies are then matched
+        from the position of their keyword only.
+        """
+        from_tables = []
+        join_tables = []
+        where_pos = None
+        order_pos = None
+        
+        # Skip the clause alternatives entirely when neither keyword occurs;
+        # every TABLE_TOKEN_RE match has a table, so the clause branches below are never reached
+        query_lower = query.lower()
+        if 'where' in query_lower or 'order by' in query_lower:
+            token_re = SQL_TOKEN_RE
+        else:
+            token_re = TABLE_TOKEN_RE
         
-        conditions = []
-        where_matches = where_pattern.findall(query)
+        for match in token_re.finditer(query):
+            if match.group('table'):
+                table = sys.intern(match.group('table'))
+                if match.group('kw').lower() == 'from':
+                    from_tables.append(table)
+                else:
+                    join_tables.append(table)
+            elif match.group('where') and where_pos is None:
+                where_pos = match.start()
+            elif match.group('order') and order_pos is None:
+                order_pos = match.start()
         
-        if where_matches:
-            where_clause = where_matches[0].strip()
-            condition_matches = condition_pattern.findall(where_clause)
-            conditions = [col.split('.')[-1] if '.' in col else col for col in condition_matches]
-            
-        return conditions
-    
-    def _extract_ordering_from_query(self, query):
-        """Extract ORDER BY columns from a SQL query."""
-        # Simple regex to find ordering columns
-        order_pattern = re.compile(r'order by\s+(.*?)(?:limit|$)', re.IGNORECASE | re.DOTALL)
+        # FROM tables are listed before JOIN tables
+        tables = from_tables + join_tables
         
-        ordering = []
-        order_matches = order_pattern.findall(query)
+        conditions = []
+        if where_pos is not None:
+            where_clause = WHERE_RE.match(query, where_pos).group(1).strip()
+            condition_matches = CONDITION_RE.findall(where_clause)
+            conditions = [sys.intern(col.split('.')[-1].lower()) for col in condition_matches]
         
-        if order_matches:
-            order_clause = order_matches[0].strip()
+        ordering = []
+        if order_pos is not None:
+            order_clause = ORDER_RE.match(query, order_pos).group(1).strip()
             # Split by commas and extract column names
             for item in order_clause.split(','):
                 col = item.strip().split()[0]  # Get just the column name, not ASC/DESC
-                ordering.append(col.split('.')[-1] if '.' in col else col)
-            
-        return ordering
+                ordering.append(sys.intern(col.split('.')[-1].lower()))
+        
+        return tables, conditions, ordering
     
     def _map_data_type(self, relational_type):
         """Map relational data types to Cassandra data types."""
-        relational_type = relational_type.lower()
-        
-        # Mapping of common SQL types to Cassandra types
-        type_map = {
-            'int': 'int',
-            'integer': 'int',
-            'smallint': 'smallint',
-            'bigint': 'bigint',
-            'tinyint': 'tinyint',
-            'varchar': 'text',
-            'char': 'text',
-            'text': 'text',
-            'string': 'text',
-            'float': 'float',
-            'double': 'double',
-            'decimal': 'decimal',
-            'boolean': 'boolean',
-            'bool': 'boolean',
-            'date': 'date',
-            'time': 'time',
-            'timestamp': 'timestamp',
-            'datetime': 'timestamp',
-            'uuid': 'uuid',
-            'blob': 'blob'
-        }
-        
-        # Handle types with length specifications like varchar(255)
-        base_type = relational_type.split('(')[0].lower()
-        
-        if base_type in type_map:
-            return type_map[base_type]
-        else:
-            print(f"Warning: Unknown data type '{relational_type}', defaulting to 'text'")
-            return 'text'
+        return map_data_type(relational_type)
     
     def analyze_and_convert(self):
         """Analyze the relational schema and convert to Cassandra tables."""
@@ -205,36 +293,72 @@ class RelationalToCassandraConverter:
         
         return True
     
+    def get_cache_file(self, schema_file, queries_file=None, cache_dir=CACHE_DIR):
+        """Return the cache file for a schema/queries pair, keyed by a SHA-1 of their contents."""
+        digest = hashlib.sha1(CACHE_VERSION.encode())
+        for path in (schema_file, queries_file):
+            digest.update(b'|')
+            if path and os.path.exists(path):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        
+        return os.path.join(cache_dir, f"{digest.hexdigest()}.json")
+    
+    def load_cached_tables(self, cache_file):
+        """Load previously converted Cassandra tables from the cache. Returns False on a miss."""
+        if not os.path.exists(cache_file):
+            return False
+            
+        try:
+            with open(cache_file, 'rb') as f:
+                self.cassandra_tables = json_loads(f.read())
+            return True
+        except Exception as e:
+            print(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return False
+    
+    def save_cached_tables(self, cache_file):
+        """Save the converted Cassandra tables to the cache."""
+        try:
+            os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+            # Write to a temporary file first so concurrent runs never see a partial cache entry
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.cassandra_tables, f)
+            os.replace(tmp_file, cache_file)
+            return True
+        except Exception as e:
+            print(f"Error saving cache: {e}")
+            return False
+    
     def _analyze_relationships(self):
         """Analyze relationships between tables to guide denormalization."""
-        print("Analyzing table relationships...")
+        logger.info("Analyzing table relationships...")
         
         # For each table, determine potential denormalizations based on relationships
-        for table_name, related_tables in self.relationships.items():
-            print(f"Table '{table_name}' has relationships with: {', '.join(related_tables)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for table_name, related_tables in self.relationships.items():
+                logger.debug("Table '%s' has relationships with: %s", table_name, ', '.join(related_tables))
+        
+        # The pairing counts are only reported, so skip them when nobody will see them
+        if not logger.isEnabledFor(logging.INFO):
+            return
             
-        # Identify tables frequently queried together (from access patterns)
-        table_pairs = []
+        # Count tables frequently queried together (from access patterns).
+        # Pairs are deduplicated and sorted so (a, b) and (b, a) count as one pairing.
+        pair_counts = Counter()
         for pattern in self.access_patterns:
-            tables = pattern['tables']
-            for i in range(len(tables)):
-                for j in range(i+1, len(tables)):
-                    table_pairs.append((tables[i], tables[j]))
-        
-        # Count frequency of table pairs
-        pair_counts = defaultdict(int)
-        for pair in table_pairs:
-            pair_counts[pair] += 1
+            pair_counts.update(combinations(sorted(set(pattern['tables'])), 2))
             
-        # Print most common table pairings
+        # Report most common table pairings
         if pair_counts:
-            print("\nMost common table pairings in queries:")
-            for pair, count in sorted(pair_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                print(f"  {pair[0]} and {pair[1]}: {count} occurrences")
+            logger.info("\nMost common table pairings in queries:")
+            for pair, count in pair_counts.most_common(5):
+                logger.info("  %s and %s: %d occurrences", pair[0], pair[1], count)
     
     def _create_cassandra_tables(self):
         """Create Cassandra tables based on analysis."""
-        print("\nCreating Cassandra tables...")
+        logger.info("\nCreating Cassandra tables...")
         
         # First pass: Create base tables from relational tables
         for table_name, table_info in self.relational_tables.items():
@@ -256,15 +380,13 @@ class RelationalToCassandraConverter:
             else:
                 # If no PK, we'll need to create one (possibly using a UUID)
                 partition_key = ['id']
-                print(f"Warning: Table '{table_name}' has no primary key. Using 'id' as default partition key.")
+                logger.warning("Warning: Table '%s' has no primary key. Using 'id' as default partition key.", table_name)
             
             # Adjust based on access patterns
             self._adjust_keys_from_access_patterns(table_name, partition_key, clustering_columns)
             
             # Define columns
-            columns = {}
-            for col_name, col_info in table_info['columns'].items():
-                columns[col_name.lower()] = col_info['type']
+            columns = {col_name: col_info['type'] for col_name, col_info in table_info['columns'].items()}
                 
             # If we added an 'id' partition key but it doesn't exist, add it
             if 'id' in partition_key and 'id' not in columns:
@@ -282,10 +404,15 @@ class RelationalToCassandraConverter:
     
     def _adjust_keys_from_access_patterns(self, table_name, partition_key, clustering_columns):
         """Adjust partition keys and clustering columns based on query patterns."""
-        table_patterns = [p for p in self.access_patterns if table_name in p['tables']]
+        table_patterns = self.patterns_by_table.get(table_name, [])
         
         if not table_patterns:
             return
+        
+        # Sets mirror the key lists for constant-time membership checks
+        known_columns = self.relational_tables[table_name]['columns'].keys()
+        pk_set = set(partition_key)
+        cc_set = set(clustering_columns)
             
         # Look for columns frequently used in WHERE clauses
         where_columns = []
@@ -293,21 +420,20 @@ class RelationalToCassandraConverter:
             where_columns.extend(pattern['conditions'])
             
         # Count frequency of each column in WHERE clauses
-        col_counts = defaultdict(int)
-        for col in where_columns:
-            col_counts[col] += 1
-            
+        col_counts = Counter(where_columns)
+
         # Find the most common WHERE column
         if col_counts:
-            most_common = max(col_counts.items(), key=lambda x: x[1])[0]
-            if most_common in self.relational_tables[table_name]['columns']:
+            most_common = col_counts.most_common(1)[0][0]
+            if most_common in known_columns:
                 # If it's not already in primary key, consider it for partition key
-                if most_common not in partition_key + clustering_columns:
+                if most_common not in pk_set and most_common not in cc_set:
                     # Replace partition key or add it
                     if not partition_key:
                         partition_key.append(most_common)
+                        pk_set.add(most_common)
                     else:
-                        print(f"Consider using '{most_common}' as partition key for table '{table_name}'")
+                        logger.info("Consider using '%s' as partition key for table '%s'", most_common, table_name)
         
         # Look for columns used in ORDER BY
         order_columns = []
@@ -316,52 +442,44 @@ class RelationalToCassandraConverter:
             
         # Add order columns to clustering columns if not already there
         for col in order_columns:
-            if col in self.relational_tables[table_name]['columns'] and col not in partition_key and col not in clustering_columns:
+            if col in known_columns and col not in pk_set and col not in cc_set:
                 clustering_columns.append(col)
-                print(f"Added '{col}' as clustering column for table '{table_name}'")
+                cc_set.add(col)
+                logger.info("Added '%s' as clustering column for table '%s'", col, table_name)
     
     def _create_denormalized_tables(self):
         """Create denormalized tables based on relationships and access patterns."""
-        print("\nCreating denormalized tables based on relationships...")
+        logger.info("\nCreating denormalized tables based on relationships...")
         
-        # Identify candidate tables for denormalization from access patterns
-        denorm_candidates = []
+        # Identify candidate tables for denormalization from access patterns.
+        # Candidates are keyed by the unordered table pair so each pair is only
+        # considered once; the dict keeps the first-seen orientation and order.
+        denorm_candidates = {}
         
         for pattern in self.access_patterns:
             tables = pattern['tables']
             if len(tables) >= 2:
                 # If multiple tables are queried together, they're candidates for denormalization
-                for i in range(len(tables)):
-                    for j in range(i+1, len(tables)):
-                        t1, t2 = tables[i], tables[j]
-                        # Check if there's a relationship between these tables
-                        if t2 in self.relationships.get(t1, []) or t1 in self.relationships.get(t2, []):
-                            denorm_candidates.append((t1, t2))
+                for t1, t2 in combinations(tables, 2):
+                    # Check if there's a relationship between these tables
+                    if t2 in self.related_tables.get(t1, ()) or t1 in self.related_tables.get(t2, ()):
+                        denorm_candidates.setdefault(frozenset((t1, t2)), (t1, t2))
         
         # Create denormalized tables for frequent patterns
-        created_denorm_tables = set()
-        for t1, t2 in denorm_candidates:
-            denorm_name = f"{t1.lower()}_{t2.lower()}_by"
-            
-            # Skip if we already created this denormalized table
-            if denorm_name in created_denorm_tables:
-                continue
-                
+        for t1, t2 in denorm_candidates.values():
             # Determine the direction of the relationship
-            is_t1_parent = any(fk['references_table'] == t1 for fk in self.foreign_keys.get(t2, []))
-            is_t2_parent = any(fk['references_table'] == t2 for fk in self.foreign_keys.get(t1, []))
+            is_t1_parent = t1 in self.fk_targets.get(t2, ())
+            is_t2_parent = t2 in self.fk_targets.get(t1, ())
             
             if is_t1_parent:
                 # t1 is parent, t2 is child
                 self._create_parent_child_denormalized_table(t1, t2)
-                created_denorm_tables.add(denorm_name)
             elif is_t2_parent:
                 # t2 is parent, t1 is child
                 self._create_parent_child_denormalized_table(t2, t1)
-                created_denorm_tables.add(denorm_name)
             else:
                 # Many-to-many or no direct relationship
-                print(f"No direct parent-child relationship found between {t1} and {t2}")
+                logger.info("No direct parent-child relationship found between %s and %s", t1, t2)
     
     def _create_parent_child_denormalized_table(self, parent, child):
         """Create a denormalized table combining a parent and child table."""
@@ -370,6 +488,11 @@ class RelationalToCassandraConverter:
         
         if not parent_info or not child_info:
             return
+        
+        # Parent's partition column; like base tables, fall back to a uuid 'id' column
+        parent_columns = parent_info['columns']
+        pk0 = parent_info['primary_key'][0] if parent_info['primary_key'] else 'id'
+        pk0_type = parent_columns[pk0]['type'] if pk0 in parent_columns else 'uuid'
             
         # Get foreign key column linking child to parent
         fk_column = None
@@ -379,63 +502,61 @@ class RelationalToCassandraConverter:
                 break
                 
         if not fk_column:
-            print(f"Couldn't find foreign key from {child} to {parent}")
+            logger.warning("Couldn't find foreign key from %s to %s", child, parent)
             return
             
         # Create table name
         denorm_name = f"{parent.lower()}_with_{child.lower()}"
         
         # Start with parent's columns and keys
-        columns = parent_info['columns'].copy()
-        partition_key = parent_info['primary_key'][:1] if parent_info['primary_key'] else ['id']
+        columns = {col_name: col_info['type'] for col_name, col_info in parent_columns.items()}
+        columns.setdefault(pk0, pk0_type)
+        partition_key = [pk0]
         clustering_columns = []
         
         # Add relevant columns from child (except the FK column)
         for col_name, col_info in child_info['columns'].items():
             if col_name != fk_column:
                 # Add a prefix to avoid name collisions
-                new_col_name = f"{child.lower()}_{col_name.lower()}"
-                columns[new_col_name] = col_info
+                new_col_name = f"{child.lower()}_{col_name}"
+                columns[new_col_name] = col_info['type']
         
         # Add child's primary key (except FK) to clustering columns
         for pk_col in child_info['primary_key']:
             if pk_col != fk_column:
-                clustering_col = f"{child.lower()}_{pk_col.lower()}"
+                clustering_col = f"{child.lower()}_{pk_col}"
                 clustering_columns.append(clustering_col)
         
         # Store the denormalized table
         self.cassandra_tables[denorm_name] = {
-            'columns': {col_name.lower(): col_type for col_name, col_type in columns.items()},
+            'columns': columns,
             'partition_key': partition_key,
             'clustering_columns': clustering_columns,
             'denormalized': True,
             'source_tables': [parent, child]
         }
         
-        print(f"Created denormalized table '{denorm_name}' combining {parent} and {child}")
+        logger.info("Created denormalized table '%s' combining %s and %s", denorm_name, parent, child)
         
         # Also create a table for querying child records by parent
         by_parent_name = f"{child.lower()}_by_{parent.lower()}"
         
         # Convert columns to dict with types
-        by_parent_columns = {}
-        for col_name, col_info in child_info['columns'].items():
-            by_parent_columns[col_name.lower()] = col_info['type']
+        by_parent_columns = {col_name: col_info['type'] for col_name, col_info in child_info['columns'].items()}
             
         # Add parent's primary key as the partition key
-        partition_col = parent_info['primary_key'][0].lower()
-        by_parent_columns[partition_col] = parent_info['columns'][parent_info['primary_key'][0]]['type']
+        by_parent_columns[pk0] = pk0_type
         
         self.cassandra_tables[by_parent_name] = {
             'columns': by_parent_columns,
-            'partition_key': [partition_col],
-            'clustering_columns': [col.lower() for col in child_info['primary_key'] if col != fk_column],
+            'partition_key': [pk0],
+            'clustering_columns': [col for col in child_info['primary_key'] if col != fk_column],
             'denormalized': True,
             'source_tables': [parent, child],
-            'query_pattern': f"SELECT * FROM {by_parent_name} WHERE {partition_col} = ?"
+            'query_pattern': f"SELECT * FROM {by_parent_name} WHERE {pk0} = ?"
         }
         
-        print(f"Created lookup table '{by_parent_name}' for querying {child} by {parent}")
+        logger.info("Created lookup table '%s' for querying %s by %s", by_parent_name, child, parent)
     
     def generate_cql(self):
         """Generate CQL statements for the Cassandra schema."""
@@ -443,85 +564,67 @@ class RelationalToCassandraConverter:
             print("No Cassandra tables defined. Please analyze and convert first.")
             return ""
             
-        cql_statements = [
-            "-- Cassandra Schema Generated from Relational Model",
-            "-- Generated by Relational to Cassandra Converter\n",
-            "-- Create keyspace (adjust replication strategy as needed)",
-            "CREATE KEYSPACE IF NOT EXISTS converted_schema WITH REPLICATION = {",
-            "    'class': 'SimpleStrategy',",
-            "    'replication_factor': 3",
-            "};\n",
-            "USE converted_schema;\n"
-        ]
+        return ''.join(self._iter_cql())
+    
+    def _iter_cql(self):
+        """Yield the CQL script for the Cassandra schema in chunks, one per table."""
+        yield CQL_HEADER + "\n"
         
-        # Generate CQL for each table
+        # Generate one CQL block per table
         for table_name, table_info in self.cassandra_tables.items():
             # Add comment for denormalized tables
+            comments = ""
             if table_info.get('denormalized'):
                 source_tables = table_info.get('source_tables', [])
-                cql_statements.append(f"-- Denormalized table combining {' and '.join(source_tables)}")
+                comments = f"-- Denormalized table combining {' and '.join(source_tables)}\n"
                 if 'query_pattern' in table_info:
-                    cql_statements.append(f"-- Query pattern: {table_info['query_pattern']}")
-            
-            # Start CREATE TABLE statement
-            cql_statements.append(f"CREATE TABLE IF NOT EXISTS {table_name} (")
+                    comments += f"-- Query pattern: {table_info['query_pattern']}\n"
             
             # Add columns
-            column_lines = []
-            for col_name, col_type in table_info['columns'].items():
-                column_lines.append(f"    {col_name} {col_type}")
+            column_lines = [f"    {col_name} {col_type}" for col_name, col_type in table_info['columns'].items()]
             
             # Add primary key
             pk_parts = []
             if table_info['partition_key']:
                 if len(table_info['partition_key']) == 1:
-                    pk_parts.append(table_info['partition_key'][0].lower())
+                    pk_parts.append(table_info['partition_key'][0])
                 else:
-                    pk_parts.append(f"({', '.join(col.lower() for col in table_info['partition_key'])})")
+                    pk_parts.append(f"({', '.join(table_info['partition_key'])})")
                     
             if table_info['clustering_columns']:
-                pk_parts.extend(col.lower() for col in table_info['clustering_columns'])
+                pk_parts.extend(table_info['clustering_columns'])
                 
             if pk_parts:
                 column_lines.append(f"    PRIMARY KEY ({', '.join(pk_parts)})")
             
-            cql_statements.append(',\n'.join(column_lines))
-            
             # Add WITH clause for clustering order if needed
             if table_info['clustering_columns']:
-                cql_statements.append(") WITH CLUSTERING ORDER BY (")
-                order_parts = [f"{col.lower()} ASC" for col in table_info['clustering_columns']]
-                cql_statements.append(', '.join(order_parts))
-                cql_statements.append(");")
+                order_parts = ', '.join(f"{col} ASC" for col in table_info['clustering_columns'])
+                closing = f") WITH CLUSTERING ORDER BY (\n{order_parts}\n);"
             else:
-                cql_statements.append(");")
+                closing = ");"
             
-            # Add empty line between tables
-            cql_statements.append("")
+            # Close the statement and leave an empty line between tables
+            columns_sql = ',\n'.join(column_lines)
+            yield f"{comments}CREATE TABLE IF NOT EXISTS {table_name} (\n{columns_sql}\n{closing}\n\n"
         
         # Add notes on usage
-        cql_statements.append("-- Notes on Cassandra Data Model:")
-        cql_statements.append("-- 1. Tables are designed to optimize for specific query patterns")
-        cql_statements.append("-- 2. Data is denormalized - the same data may exist in multiple tables")
-        cql_statements.append("-- 3. Updates must be performed on all tables containing the data")
-        cql_statements.append("-- 4. Always query by partition key for best performance")
-        
-        return '\n'.join(cql_statements)
+        yield CQL_FOOTER
     
     def save_cql(self, output_file):
-        """Save the generated CQL to a file."""
-        cql = self.generate_cql()
-        
-        if cql:
-            try:
-                with open(output_file, 'w') as f:
-                    f.write(cql)
-                print(f"CQL schema saved to {output_file}")
-                return True
-            except Exception as e:
-                print(f"Error saving CQL: {e}")
-                return False
-        return False
+        """Save the generated CQL to a file, streaming it one table at a time."""
+        if not self.cassandra_tables:
+            print("No Cassandra tables defined. Please analyze and convert first.")
+            return False
+            
+        try:
+            with open(output_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_cql())
+            print(f"CQL schema saved to {output_file}")
+            return True
+        except Exception as e:
+            print(f"Error saving CQL: {e}")
+            return False
     
     def generate_access_pattern_summary(self):
         """Generate a summary of access patterns and recommended query practices."""
@@ -585,7 +688,7 @@ class RelationalToCassandraConverter:
         
         if summary:
             try:
-                with open(output_file, 'w') as f:
+                with open(output_file, 'w', buffering=WRITE_BUFFER_SIZE) as f:
                     f.write(summary)
                 print(f"Access pattern summary saved to {output_file}")
                 return True
@@ -600,9 +703,14 @@ def main():
     parser.add_argument('--output', '-o', required=True, help='Output CQL file')
     parser.add_argument('--queries', '-q', help='File containing common query patterns (optional)')
     parser.add_argument('--summary', '-s', help='Output file for access pattern summary (optional)')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-run the conversion instead of using cached results')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Report per-table conversion details')
     
     args = parser.parse_args()
     
+    # Conversion details are logged; only warnings are shown unless --verbose is given
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format='%(message)s', stream=sys.stdout)
+    
     converter = RelationalToCassandraConverter()
     
     # Load schema
@@ -613,9 +721,16 @@ def main():
     if args.queries:
         converter.load_queries(args.queries)
     
-    # Analyze and convert
-    if not converter.analyze_and_convert():
-        return 1
+    # Reuse a cached conversion of the same inputs, or analyze and convert
+    cache_file = None if args.no_cache else converter.get_cache_file(args.input, args.queries)
+    
+    if cache_file and converter.load_cached_tables(cache_file):
+        print(f"Using cached conversion from {cache_file}")
+    else:
+        if not converter.analyze_and_convert():
+            return 1
+        if cache_file:
+            converter.save_cached_tables(cache_file)
     
     # Save CQL
     if not converter.save_cql(args.output):
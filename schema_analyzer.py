@@ -8,25 +8,323 @@ and generates detailed PDF reports with recommendations for optimization.
 
 import json
 import argparse
+import array
+import bisect
+import glob
+import hashlib
+import heapq
+import io
 import os
 import re
+import shutil
 from collections import defaultdict, Counter
-import networkx as nx
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak, ListFlowable, ListItem
-from reportlab.graphics.shapes import Drawing, Line
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.lib.units import inch
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import itertools
+from operator import itemgetter
+
+# Stream tables out of large schema files with ijson when it is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# SQL-parsing patterns used when analyzing query access patterns
+FROM_JOIN_RE = re.compile(r'(from|join)\s+([a-zA-Z0-9_]+)', re.IGNORECASE)
+WHERE_RE = re.compile(r'where\s+(.*?)(?:order by|group by|limit|$)', re.IGNORECASE | re.DOTALL)
+CONDITION_RE = re.compile(r'([a-zA-Z0-9_.]+)\s*(?:=|>|<|>=|<=|!=|LIKE|IN)\s*')
+ORDER_RE = re.compile(r'order by\s+(.*?)(?:limit|$)', re.IGNORECASE | re.DOTALL)
+
+# Column type substrings that are problematic in Cassandra, checked in order
+PROBLEMATIC_TYPE_ISSUES = {
+    'float': 'Floating-point types can cause precision issues',
+    'real': 'Floating-point types can cause precision issues',
+    'decimal': 'Consider using bigint with scaled integers instead'
+}
+
+# Suggested replacements keyed by column type substring, checked in order. A
+# decimal with explicit precision and scale gets a concrete multiplier instead.
+TYPE_SUGGESTIONS = {
+    'float': "Replace with 'decimal' or use scaled integers stored as 'bigint' for precise calculations",
+    'real': "Replace with 'decimal' or use scaled integers stored as 'bigint' for precise calculations",
+    'decimal': "Convert to 'bigint' with appropriate scaling factor",
+    'datetime': "Use 'timestamp' type in Cassandra",
+    'varchar': "Use 'text' type in Cassandra",
+    'char': "Use 'text' type in Cassandra",
+    'enum': "Replace with 'text' type in Cassandra",
+    'json': "Use 'text' type and handle JSON serialization in application code"
+}
+DECIMAL_RE = re.compile(r'decimal\((\d+),(\d+)\)')
+
+# Maximum number of data rows per Table flowable in the PDF report
+TABLE_CHUNK_ROWS = 50
+
+# Table styling shared by the PDF report: a dark header row over a plain grid,
+# plus the compact body rows used by the detailed analysis tables. Colours are
+# given by name so reportlab is only imported when a report is generated.
+HEADER_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), 'darkblue'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), 'white'),
+    ('GRID', (0, 0), (-1, -1), 1, 'black'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+)
+COMPACT_ROW_STYLE = (
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('TOPPADDING', (0, 1), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
+)
+
+# Score bands shared by the PDF report: a score at or above a threshold falls in
+# the next band up
+SCORE_THRESHOLDS = (40, 60, 80)
+SCORE_LABELS = ('Poor', 'Fair', 'Good', 'Excellent')
+SCORE_COLORS = ('red', 'red', 'orange', 'green')
+OVERALL_ASSESSMENTS = (
+    "NEEDS WORK: Significant optimizations required for effective Cassandra implementation.",
+    "NEEDS WORK: Significant optimizations required for effective Cassandra implementation.",
+    "GOOD: This schema can work with Cassandra but needs moderate optimizations.",
+    "EXCELLENT: This schema is well-suited for Cassandra with minor optimizations needed."
+)
+
+# Generated reports are cached on disk, keyed by a hash of the input files.
+# Bump CACHE_VERSION whenever the analysis or report layout changes its output.
+CACHE_DIR = '.schema_analyzer_cache'
+CACHE_VERSION = '1'
+
+# Output paths that discard the report; writing to them skips PDF rendering (dry runs)
+NULL_OUTPUTS = frozenset((os.devnull, '/dev/null'))
+
+# Best-practice categories in the order they are charted
+SCORE_CATEGORY_KEYS = ('primary_keys', 'data_types', 'denormalization', 'query_patterns')
+SCORE_CATEGORY_NAMES = ('Primary Keys', 'Data Types', 'Denormalization', 'Query Patterns')
+
+# Paragraph markup for recommendation bullets in the PDF report
+REC_TEMPLATE = "<b>%s:</b> %s<br/>%s<br/><i>Suggested solution:</i> %s"
+SHORT_REC_TEMPLATE = "<b>%s:</b> %s<br/>%s"
+
+# Static best-practice bullets for the scorecard sections of the PDF report
+PK_BEST_PRACTICES = (
+    "Partition keys should distribute data evenly across nodes",
+    "Avoid high-cardinality partition keys to prevent hotspots",
+    "Use composite keys (partition key + clustering columns) for efficient data retrieval",
+    "Order clustering columns based on query patterns",
+    "Keep related data in the same partition to minimize reads"
+)
+DATA_TYPE_BEST_PRACTICES = (
+    "Use text instead of varchar for string data",
+    "Prefer bigint over decimal for numeric values requiring precision",
+    "Use collections (list, set, map) for small groups of related data",
+    "Use UUID type for globally unique identifiers",
+    "Avoid using floating-point types for exact calculations"
+)
+DENORMALIZATION_BEST_PRACTICES = (
+    "Design tables around query patterns, not entity relationships",
+    "Duplicate data across tables to minimize joins",
+    "Use collections for one-to-few relationships",
+    "Create separate tables for each query pattern",
+    "Accept data duplication to optimize read performance"
+)
+QUERY_PATTERN_BEST_PRACTICES = (
+    "Design tables based on specific query requirements",
+    "Include all filtering columns in primary key",
+    "Order clustering columns based on sorting needs",
+    "Create separate tables for different access patterns",
+    "Avoid secondary indexes except for low-cardinality columns"
+)
+
+# Query parsing helpers are cached on the query text, since the same queries are
+# re-parsed while generating recommendations. They return tuples so cached
+# results cannot be mutated by callers.
+@lru_cache(maxsize=None)
+def extract_tables_from_query(query):
+    """Extract table names from a SQL query."""
+    # One scan finds both kinds of reference; FROM tables are still listed first
+    from_matches = []
+    join_matches = []
+    for keyword, table in FROM_JOIN_RE.findall(query):
+        if keyword.lower() == 'from':
+            from_matches.append(table)
+        else:
+            join_matches.append(table)
+
+    return tuple(from_matches + join_matches)
+
+@lru_cache(maxsize=None)
+def extract_conditions_from_query(query):
+    """Extract WHERE conditions from a SQL query."""
+    conditions = []
+    where_matches = WHERE_RE.findall(query)
+
+    if where_matches:
+        where_clause = where_matches[0].strip()
+        condition_matches = CONDITION_RE.findall(where_clause)
+        conditions = [col.split('.')[-1] if '.' in col else col for col in condition_matches]
+
+    return tuple(conditions)
+
+@lru_cache(maxsize=None)
+def extract_ordering_from_query(query):
+    """Extract ORDER BY columns from a SQL query."""
+    ordering = []
+    order_matches = ORDER_RE.findall(query)
+
+    if order_matches:
+        order_clause = order_matches[0].strip()
+        # Split by commas and extract column names
+        for item in order_clause.split(','):
+            col = item.strip().split()[0]  # Get just the column name, not ASC/DESC
+            ordering.append(col.split('.')[-1] if '.' in col else col)
+
+    return tuple(ordering)
+
+def longest_chains_from(graph, source, cutoff):
+    """
+    Return the longest simple paths of at most `cutoff` hops starting at `source`.
+    Only chains of 3+ tables are returned. The graph is walked with a single
+    depth-limited DFS that tracks the longest paths as it goes.
+    """
+    path = [source]
+    visited = {source}
+    stack = [iter(graph.successors(source))]
+    longest = []
+    
+    while stack:
+        successor = next(stack[-1], None)
+        if successor is None:
+            # Successors exhausted; backtrack
+            stack.pop()
+            visited.discard(path.pop())
+            continue
+        if successor in visited:
+            continue
+        
+        path.append(successor)
+        visited.add(successor)
+        
+        if len(path) > 2:
+            if not longest or len(path) > len(longest[0]):
+                longest = [list(path)]
+            elif len(path) == len(longest[0]):
+                longest.append(list(path))
+        
+        if len(path) <= cutoff:
+            stack.append(iter(graph.successors(successor)))
+        else:
+            visited.discard(path.pop())
+    
+    return longest
+
+# Schemas repeat a handful of column types across many columns, so suggestions
+# are cached on the declared type
+@lru_cache(maxsize=None)
+def type_suggestion(col_type):
+    """Generate suggestion for improving column data type."""
+    col_type = col_type.lower()
+    
+    for token, suggestion in TYPE_SUGGESTIONS.items():
+        if token in col_type:
+            if token == 'decimal':
+                # Extract precision and scale if available
+                match = DECIMAL_RE.search(col_type)
+                if match:
+                    precision, scale = match.groups()
+                    multiplier = 10 ** int(scale)
+                    return f"Convert to 'bigint' and multiply values by {multiplier} to preserve precision"
+            return suggestion
+    
+    return f"Review if '{col_type}' has a direct Cassandra equivalent"
+
+def score_band(score):
+    """Return the index of the SCORE_THRESHOLDS band a 0-100 score falls in."""
+    return bisect.bisect_right(SCORE_THRESHOLDS, score)
+
+def average_score(details):
+    """Return the mean 'score' of a list of per-table score details, or 0 if empty."""
+    if not details:
+        return 0
+    return sum(map(itemgetter('score'), details)) / len(details)
+
+@lru_cache(maxsize=1)
+def report_stylesheet():
+    """
+    Return the PDF report stylesheet. Styles are never modified while rendering,
+    so the sheet is built once and shared between reports; flowables are not,
+    since reportlab keeps layout state on them.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    
+    styles = getSampleStyleSheet()
+    
+    # Add custom styles - CHECK FOR EXISTING STYLES FIRST
+    custom_styles = {
+        'Heading1': ParagraphStyle(name='Heading1', fontSize=18, spaceAfter=12),
+        'Heading2': ParagraphStyle(name='Heading2', fontSize=14, spaceAfter=8, spaceBefore=12),
+        'Heading3': ParagraphStyle(name='Heading3', fontSize=12, spaceAfter=6, spaceBefore=6),
+        'TableHeader': ParagraphStyle(name='TableHeader', fontSize=10, alignment=1, textColor=colors.white, backColor=colors.darkblue),
+        'Score': ParagraphStyle(name='Score', fontSize=16, spaceBefore=12, spaceAfter=12),
+        'Note': ParagraphStyle(name='Note', fontName='Helvetica-Oblique', fontSize=10, textColor=colors.gray)
+    }
+    
+    # Only add styles that don't already exist
+    for style_name, style in custom_styles.items():
+        if style_name not in styles:
+            styles.add(style)
+    
+    return styles
+
+@lru_cache(maxsize=64)
+def score_chart(scores):
+    """
+    Return the bar chart Drawing for a tuple of category scores in
+    SCORE_CATEGORY_KEYS order. Unlike other flowables, a Drawing is redrawn
+    from its shapes on every render without keeping layout state, so reports
+    with the same scores share one.
+    """
+    from reportlab.lib import colors
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    
+    drawing = Drawing(400, 200)
+    
+    # Create and customize the bar chart
+    chart = VerticalBarChart()
+    chart.x = 50
+    chart.y = 50
+    chart.height = 125
+    chart.width = 300
+    chart.data = [array.array('d', scores)]
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = 100
+    chart.valueAxis.valueStep = 20
+    chart.categoryAxis.labels.boxAnchor = 'ne'
+    chart.categoryAxis.labels.dx = -8
+    chart.categoryAxis.labels.dy = -2
+    chart.categoryAxis.labels.angle = 30
+    chart.categoryAxis.labels.fontName = 'Helvetica'
+    chart.categoryAxis.categoryNames = list(SCORE_CATEGORY_NAMES)
+    
+    # Set bar colors
+    chart.bars[0].fillColor = colors.steelblue
+    
+    drawing.add(chart)
+    return drawing
 
 class SchemaAnalyzer:
     def __init__(self):
         self.schema = None
         self.tables = []
+        self.columns_by_table = {}
+        self.column_by_name = {}
         self.relationships = []
+        self.rels_by_from = {}
+        self.rels_by_to = {}
         self.access_patterns = []
+        self.parsed_queries = []
         self.analysis_results = {}
         self.recommendations = []
         self.best_practices_score = {}
@@ -34,10 +332,21 @@ class SchemaAnalyzer:
     def load_schema(self, schema_file):
         """Load a schema from a JSON file."""
         try:
-            with open(schema_file, 'r') as f:
-                self.schema = json.load(f)
-                self.tables = self.schema.get('tables', [])
-                return True
+            with open(schema_file, 'rb') as f:
+                if ijson:
+                    self.tables = list(ijson.items(f, 'tables.item'))
+                    self.schema = {'tables': self.tables}
+                else:
+                    self.schema = json.load(f)
+                    self.tables = self.schema.get('tables', [])
+            
+            # Index columns by table name for constant-time lookups during analysis
+            self.columns_by_table = {t['name']: t.get('columns', []) for t in self.tables}
+            self.column_by_name = {
+                table_name: {c['name']: c for c in columns}
+                for table_name, columns in self.columns_by_table.items()
+            }
+            return True
         except Exception as e:
             print(f"Error loading schema: {e}")
             return False
@@ -49,19 +358,42 @@ class SchemaAnalyzer:
             return False
             
         try:
+            # Iterate the file lazily rather than reading every line into memory first
             with open(queries_file, 'r') as f:
-                query_lines = f.readlines()
-                
-            for line in query_lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    self.access_patterns.append(line)
+                self.access_patterns.extend(
+                    line for line in (raw_line.strip() for raw_line in f)
+                    if line and not line.startswith('#')
+                )
             
             return True
         except Exception as e:
             print(f"Error loading queries: {e}")
             return False
 
+    def get_report_cache_file(self, schema_file, queries_file=None, cache_dir=CACHE_DIR):
+        """Return the cached report for a schema/queries pair, keyed by a SHA-1 of their contents."""
+        digest = hashlib.sha1(CACHE_VERSION.encode())
+        for path in (schema_file, queries_file):
+            digest.update(b'|')
+            if path and os.path.exists(path):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        
+        return os.path.join(cache_dir, f"{digest.hexdigest()}.pdf")
+    
+    def save_cached_report(self, output_file, cache_file):
+        """Copy a generated report into the cache."""
+        try:
+            os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+            # Copy to a temporary file first so concurrent runs never see a partial cache entry
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            shutil.copyfile(output_file, tmp_file)
+            os.replace(tmp_file, cache_file)
+            return True
+        except Exception as e:
+            print(f"Error saving cache: {e}")
+            return False
+    
     def analyze_schema(self):
         """Perform complete schema analysis."""
         if not self.schema:
@@ -86,31 +418,31 @@ class SchemaAnalyzer:
             columns = table.get('columns', [])
             foreign_keys = table.get('foreign_keys', [])
             
-            # Count column data types
+            # Walk the columns once, gathering types, key columns, nullability
+            # and Cassandra-problematic types together
             column_types = Counter()
-            for col in columns:
-                col_type = col.get('type', '').lower().split('(')[0]
-                column_types[col_type] += 1
-                all_column_types[col_type] += 1
-            
-            # Analyze primary key
-            primary_key_cols = [c['name'] for c in columns if c.get('primary_key', False)]
-            
-            # Check for problematic types for Cassandra
+            primary_key_cols = []
+            nullable_columns = 0
             problematic_types = []
             for col in columns:
                 col_type = col.get('type', '').lower()
-                if 'float' in col_type or 'real' in col_type:
-                    problematic_types.append((col['name'], col_type, 'Floating-point types can cause precision issues'))
-                elif 'decimal' in col_type:
-                    problematic_types.append((col['name'], col_type, 'Consider using bigint with scaled integers instead'))
+                column_types[col_type.partition('(')[0]] += 1
+                if col.get('primary_key', False):
+                    primary_key_cols.append(col['name'])
+                if col.get('nullable', True):
+                    nullable_columns += 1
+                for token, issue in PROBLEMATIC_TYPE_ISSUES.items():
+                    if token in col_type:
+                        problematic_types.append((col['name'], col_type, issue))
+                        break
+            all_column_types.update(column_types)
             
             table_stats[table_name] = {
                 'columns_count': len(columns),
                 'primary_key': primary_key_cols,
                 'foreign_keys_count': len(foreign_keys),
                 'column_types': dict(column_types),
-                'nullable_columns': sum(1 for c in columns if c.get('nullable', True)),
+                'nullable_columns': nullable_columns,
                 'problematic_types': problematic_types
             }
         
@@ -123,6 +455,9 @@ class SchemaAnalyzer:
         
     def analyze_relationships(self):
         """Analyze relationships between tables."""
+        # networkx is only needed here; importing it lazily keeps cached runs fast
+        import networkx as nx
+        
         # Create a graph to represent table relationships
         graph = nx.DiGraph()
         
@@ -143,6 +478,13 @@ class SchemaAnalyzer:
                         'to_column': fk.get('references', {}).get('column')
                     })
         
+        # Index relationships by both ends for the recommendation helpers
+        self.rels_by_from = defaultdict(list)
+        self.rels_by_to = defaultdict(list)
+        for rel in self.relationships:
+            self.rels_by_from[rel['from_table']].append(rel)
+            self.rels_by_to[rel['to_table']].append(rel)
+        
         # Find tables with high connectivity
         high_connectivity_tables = []
         for node in graph.nodes():
@@ -186,30 +528,18 @@ class SchemaAnalyzer:
                     })
         
         # Identify one-to-many relationships (most common FK relationships)
+        m2m_pairs = {(m['junction_table'], t) for m in many_to_many for t in m['connected_tables']}
         for rel in self.relationships:
-            if (rel['from_table'], rel['to_table']) not in [(m['junction_table'], t) for m in many_to_many for t in m['connected_tables']]:
+            if (rel['from_table'], rel['to_table']) not in m2m_pairs:
                 one_to_many.append(rel)
         
-        # Build relationship chains
-        chains = []
+        # Build relationship chains: the longest chains starting at each table,
+        # de-duplicated while preserving discovery order
+        chain_keys = {}
         for node in graph.nodes():
-            paths = []
-            for target in graph.nodes():
-                if node != target:
-                    # Find all paths between the two nodes
-                    try:
-                        all_paths = list(nx.all_simple_paths(graph, node, target, cutoff=3))
-                        paths.extend(all_paths)
-                    except:
-                        pass
-            
-            # Keep only the longest chains
-            if paths:
-                max_len = max(len(p) for p in paths)
-                longest_paths = [p for p in paths if len(p) >= max_len]
-                for path in longest_paths:
-                    if len(path) > 2:  # Only consider chains of 3+ tables
-                        chains.append(path)
+            for path in longest_chains_from(graph, node, cutoff=3):
+                chain_keys.setdefault(tuple(path), None)
+        chains = [list(path) for path in chain_keys]
         
         self.analysis_results['relationships'] = {
             'total_relationships': len(self.relationships),
@@ -222,6 +552,7 @@ class SchemaAnalyzer:
 
     def analyze_access_patterns(self):
         """Analyze query access patterns."""
+        self.parsed_queries = []
         if not self.access_patterns:
             self.analysis_results['access_patterns'] = {
                 'no_queries_provided': True
@@ -229,15 +560,20 @@ class SchemaAnalyzer:
             return
             
         join_patterns = []
-        where_conditions = []
-        order_by_columns = []
+        where_counts = Counter()
+        order_by_counts = Counter()
         tables_in_queries = Counter()
+        tables_in_joins = Counter()
+        joined_with = defaultdict(Counter)
         
         for query in self.access_patterns:
             # Extract tables in the query
             tables = self._extract_tables_from_query(query)
-            for table in tables:
-                tables_in_queries[table] += 1
+            tables_in_queries.update(tables)
+            
+            # Keep each query's tables and WHERE conditions for the recommendation helpers
+            conditions = self._extract_conditions_from_query(query)
+            self.parsed_queries.append((frozenset(tables), conditions))
                 
             # Analyze joins
             if len(tables) > 1:
@@ -246,82 +582,50 @@ class SchemaAnalyzer:
                     'query': query
                 })
                 
+                # Track how often each table is joined, and with which other tables
+                tables_in_joins.update(tables)
+                for table in dict.fromkeys(tables):
+                    for other in tables:
+                        if other != table:
+                            joined_with[table][other] += 1
+                
             # Analyze WHERE conditions
-            conditions = self._extract_conditions_from_query(query)
-            if conditions:
-                where_conditions.extend(conditions)
+            where_counts.update(conditions)
                 
             # Analyze ORDER BY
-            ordering = self._extract_ordering_from_query(query)
-            if ordering:
-                order_by_columns.extend(ordering)
+            order_by_counts.update(self._extract_ordering_from_query(query))
                 
         # Summarize results
         most_queried_tables = tables_in_queries.most_common(5)
-        most_common_where = Counter(where_conditions).most_common(5)
-        most_common_ordering = Counter(order_by_columns).most_common(5)
+        most_common_where = heapq.nlargest(5, where_counts.items(), key=itemgetter(1))
+        most_common_ordering = heapq.nlargest(5, order_by_counts.items(), key=itemgetter(1))
         
         self.analysis_results['access_patterns'] = {
             'total_queries': len(self.access_patterns),
             'most_queried_tables': most_queried_tables,
             'join_patterns': join_patterns,
+            'tables_in_joins': tables_in_joins,
+            'joined_with': joined_with,
             'most_common_where': most_common_where,
             'most_common_ordering': most_common_ordering
         }
 
     def _extract_tables_from_query(self, query):
         """Extract table names from a SQL query."""
-        # Simple regex to find tables in FROM and JOIN clauses
-        from_pattern = re.compile(r'from\s+([a-zA-Z0-9_]+)', re.IGNORECASE)
-        join_pattern = re.compile(r'join\s+([a-zA-Z0-9_]+)', re.IGNORECASE)
-        
-        tables = []
-        from_matches = from_pattern.findall(query)
-        join_matches = join_pattern.findall(query)
-        
-        if from_matches:
-            tables.extend(from_matches)
-        if join_matches:
-            tables.extend(join_matches)
-            
-        return tables
+        return extract_tables_from_query(query)
     
     def _extract_conditions_from_query(self, query):
         """Extract WHERE conditions from a SQL query."""
-        # Simple regex to find conditions in WHERE clause
-        where_pattern = re.compile(r'where\s+(.*?)(?:order by|group by|limit|$)', re.IGNORECASE | re.DOTALL)
-        condition_pattern = re.compile(r'([a-zA-Z0-9_.]+)\s*(?:=|>|<|>=|<=|!=|LIKE|IN)\s*')
-        
-        conditions = []
-        where_matches = where_pattern.findall(query)
-        
-        if where_matches:
-            where_clause = where_matches[0].strip()
-            condition_matches = condition_pattern.findall(where_clause)
-            conditions = [col.split('.')[-1] if '.' in col else col for col in condition_matches]
-            
-        return conditions
+        return extract_conditions_from_query(query)
     
     def _extract_ordering_from_query(self, query):
         """Extract ORDER BY columns from a SQL query."""
-        # Simple regex to find ordering columns
-        order_pattern = re.compile(r'order by\s+(.*?)(?:limit|$)', re.IGNORECASE | re.DOTALL)
-        
-        ordering = []
-        order_matches = order_pattern.findall(query)
-        
-        if order_matches:
-            order_clause = order_matches[0].strip()
-            # Split by commas and extract column names
-            for item in order_clause.split(','):
-                col = item.strip().split()[0]  # Get just the column name, not ASC/DESC
-                ordering.append(col.split('.')[-1] if '.' in col else col)
-            
-        return ordering
+        return extract_ordering_from_query(query)
 
     def evaluate_against_best_practices(self):
         """Evaluate the schema against Cassandra best practices."""
         best_practices = {}
+        table_names = [t['name'] for t in self.tables]
         
         # 1. Evaluate primary key composition
         pk_scores = []
@@ -335,7 +639,7 @@ class SchemaAnalyzer:
                 issues.append("No primary key defined")
             elif len(pk) == 1:
                 # Check if this is a UUID or other high-cardinality field
-                col_type = next((c.get('type', '').lower() for c in self._get_table_columns(table_name) if c['name'] == pk[0]), "")
+                col_type = self.column_by_name[table_name][pk[0]].get('type', '').lower()
                 if 'uuid' in col_type or 'id' in pk[0].lower():
                     score = 80
                     issues.append("Single-column primary key is OK but could be improved with composite keys")
@@ -353,7 +657,7 @@ class SchemaAnalyzer:
                 'issues': issues
             })
         
-        avg_pk_score = sum(s['score'] for s in pk_scores) / len(pk_scores) if pk_scores else 0
+        avg_pk_score = average_score(pk_scores)
         best_practices['primary_keys'] = {
             'score': avg_pk_score,
             'details': pk_scores
@@ -372,7 +676,7 @@ class SchemaAnalyzer:
                 'issues': [f"{p[0]} ({p[1]}): {p[2]}" for p in problematic] if problematic else ["No data type issues"]
             })
         
-        avg_dt_score = sum(s['score'] for s in dt_scores) / len(dt_scores) if dt_scores else 0
+        avg_dt_score = average_score(dt_scores)
         best_practices['data_types'] = {
             'score': avg_dt_score,
             'details': dt_scores
@@ -386,9 +690,11 @@ class SchemaAnalyzer:
         if 'access_patterns' in self.analysis_results and not self.analysis_results['access_patterns'].get('no_queries_provided', False):
             join_patterns = self.analysis_results['access_patterns']['join_patterns']
             
-            for table_name in [t['name'] for t in self.tables]:
-                # Count joins involving this table
-                joins_count = sum(1 for j in join_patterns if table_name in j['tables'])
+            # Count the join patterns each table is involved in
+            joins_per_table = Counter(t for jp in join_patterns for t in set(jp['tables']))
+            
+            for table_name in table_names:
+                joins_count = joins_per_table[table_name]
                 
                 # Calculate score - higher joins means more denormalization needed
                 if joins_count == 0:
@@ -417,18 +723,28 @@ class SchemaAnalyzer:
             one_to_many = self.analysis_results['relationships']['one_to_many']
             many_to_many = self.analysis_results['relationships']['many_to_many']
             
-            for table_name in [t['name'] for t in self.tables]:
+            # Count the one-to-many and many-to-many relationships each table is part of
+            o2m_per_table = Counter(t for r in one_to_many for t in {r['from_table'], r['to_table']})
+            m2m_per_table = Counter(t for m in many_to_many for t in {m['junction_table'], *m['connected_tables']})
+            
+            # Index relationship chains by the tables they pass through
+            chains_by_table = defaultdict(list)
+            for chain in chains:
+                for t in chain:
+                    chains_by_table[t].append(chain)
+            
+            for table_name in table_names:
                 issues = []
                 
                 # Check if table is in relationship chains
-                table_chains = [c for c in chains if table_name in c]
+                table_chains = chains_by_table.get(table_name, [])
                 chain_count = min(len(table_chains), max_chains)
                 
                 # Check one-to-many relationships
-                o2m_count = sum(1 for r in one_to_many if r['from_table'] == table_name or r['to_table'] == table_name)
+                o2m_count = o2m_per_table[table_name]
                 
                 # Check many-to-many relationships
-                m2m_count = sum(1 for m in many_to_many if m['junction_table'] == table_name or table_name in m['connected_tables'])
+                m2m_count = m2m_per_table[table_name]
                 
                 # Calculate score - more relationships = more denormalization needed
                 relationship_factor = chain_count + o2m_count + m2m_count
@@ -467,7 +783,7 @@ class SchemaAnalyzer:
                     'issues': issues
                 })
         
-        avg_denorm_score = sum(s['score'] for s in denorm_scores) / len(denorm_scores) if denorm_scores else 0
+        avg_denorm_score = average_score(denorm_scores)
         best_practices['denormalization'] = {
             'score': avg_denorm_score,
             'details': denorm_scores
@@ -481,18 +797,19 @@ class SchemaAnalyzer:
             most_where = dict(self.analysis_results['access_patterns']['most_common_where'])
             most_order = dict(self.analysis_results['access_patterns']['most_common_ordering'])
             
-            for table_name in [t['name'] for t in self.tables]:
+            for table_name in table_names:
                 issues = []
                 
                 # Get primary key for this table
                 pk = self.analysis_results['table_structure']['table_stats'][table_name]['primary_key']
+                pk_set = frozenset(pk)
                 
                 # Check if primary key columns are used in WHERE clauses
                 pk_in_where = sum(1 for p in pk if p in most_where)
                 
                 # Check if non-primary key columns are used in WHERE clauses
                 columns = [c['name'] for c in self._get_table_columns(table_name)]
-                non_pk_cols = [c for c in columns if c not in pk]
+                non_pk_cols = [c for c in columns if c not in pk_set]
                 non_pk_in_where = sum(1 for c in non_pk_cols if c in most_where)
                 
                 # Check if columns are used in ORDER BY
@@ -539,14 +856,14 @@ class SchemaAnalyzer:
                 })
         else:
             # If no queries provided, give neutral scores
-            for table_name in [t['name'] for t in self.tables]:
+            for table_name in table_names:
                 query_scores.append({
                     'table': table_name,
                     'score': 50,
                     'issues': ["No query patterns provided to evaluate"]
                 })
         
-        avg_query_score = sum(s['score'] for s in query_scores) / len(query_scores) if query_scores else 0
+        avg_query_score = average_score(query_scores)
         best_practices['query_patterns'] = {
             'score': avg_query_score,
             'details': query_scores
@@ -569,67 +886,62 @@ class SchemaAnalyzer:
 
     def generate_recommendations(self):
         """Generate recommendations based on analysis."""
-        recommendations = []
-        
-        # 1. Primary Key Recommendations
+        self.recommendations = list(itertools.chain(
+            self._pk_recommendations(),
+            self._data_type_recommendations(),
+            self._denormalization_recommendations(),
+            self._query_pattern_recommendations(),
+            self._many_to_many_recommendations(),
+            self._hierarchy_recommendations()
+        ))
+    
+    def _pk_recommendations(self):
+        """Yield primary key recommendations for tables with low key scores."""
         low_pk_tables = [d for d in self.best_practices_score['categories']['primary_keys']['details'] if d['score'] < 70]
         if low_pk_tables:
             for table in low_pk_tables:
-                recommendations.append({
+                yield {
                     'category': 'Primary Keys',
                     'table': table['table'],
                     'recommendation': f"Improve primary key design for table '{table['table']}'",
                     'details': "; ".join(table['issues']),
                     'suggested_fix': self._generate_pk_suggestion(table['table'])
-                })
-        
-        # 2. Data Type Recommendations
-        problematic_types = []
+                }
+    
+    def _data_type_recommendations(self):
+        """Yield data type recommendations for columns with problematic types."""
         for table_name, stats in self.analysis_results['table_structure']['table_stats'].items():
             for col_name, col_type, issue in stats['problematic_types']:
-                problematic_types.append({
+                yield {
                     'category': 'Data Types',
                     'table': table_name,
                     'column': col_name,
                     'recommendation': f"Replace {col_type} with a more Cassandra-friendly type",
                     'details': issue,
                     'suggested_fix': self._generate_type_suggestion(col_type)
-                })
-        
-        recommendations.extend(problematic_types)
-        
-        # 3. Denormalization Recommendations
+                }
+    
+    def _denormalization_recommendations(self):
+        """Yield denormalization recommendations for frequently joined tables."""
         # Focus on tables involved in most queries with joins
         if 'access_patterns' in self.analysis_results and not self.analysis_results['access_patterns'].get('no_queries_provided', False):
-            join_patterns = self.analysis_results['access_patterns']['join_patterns']
-            
-            # Count tables in joins
-            tables_in_joins = Counter()
-            for jp in join_patterns:
-                for table in jp['tables']:
-                    tables_in_joins[table] += 1
+            tables_in_joins = self.analysis_results['access_patterns']['tables_in_joins']
+            joined_with = self.analysis_results['access_patterns']['joined_with']
             
             # Recommend denormalization for frequently joined tables
             for table, count in tables_in_joins.most_common(5):
-                if count >= 2:  # Arbitrary threshold
-                    joined_with = []
-                    for jp in join_patterns:
-                        if table in jp['tables']:
-                            for other in jp['tables']:
-                                if other != table:
-                                    joined_with.append(other)
-                    
-                    if joined_with:
-                        top_joins = Counter(joined_with).most_common(3)
-                        recommendations.append({
-                            'category': 'Denormalization',
-                            'table': table,
-                            'recommendation': f"Denormalize data from related tables into '{table}'",
-                            'details': f"Table '{table}' is joined with {', '.join([f'{t} ({c} times)' for t, c in top_joins])}",
-                            'suggested_fix': self._generate_denorm_suggestion(table, [t for t, _ in top_joins])
-                        })
-        
-        # 4. Query Pattern Recommendations
+                if count >= 2 and joined_with.get(table):  # Arbitrary threshold
+                    top_joins = joined_with[table].most_common(3)
+                    yield {
+                        'category': 'Denormalization',
+                        'table': table,
+                        'recommendation': f"Denormalize data from related tables into '{table}'",
+                        'details': f"Table '{table}' is joined with {', '.join([f'{t} ({c} times)' for t, c in top_joins])}",
+                        'suggested_fix': self._generate_denorm_suggestion(table, [t for t, _ in top_joins])
+                    }
+    
+    def _query_pattern_recommendations(self):
+        """Yield query pattern recommendations for tables whose keys miss common WHERE columns."""
         if 'access_patterns' in self.analysis_results and not self.analysis_results['access_patterns'].get('no_queries_provided', False):
             # Identify tables with misaligned query patterns
             query_issues = [d for d in self.best_practices_score['categories']['query_patterns']['details'] if d['score'] < 60]
@@ -638,9 +950,9 @@ class SchemaAnalyzer:
                 table_name = table['table']
                 # Get where conditions for this table's queries
                 where_cols = []
-                for query in self.access_patterns:
-                    if table_name in self._extract_tables_from_query(query):
-                        where_cols.extend(self._extract_conditions_from_query(query))
+                for tables, conditions in self.parsed_queries:
+                    if table_name in tables:
+                        where_cols.extend(conditions)
                 
                 if where_cols:
                     most_common = Counter(where_cols).most_common(3)
@@ -649,47 +961,44 @@ class SchemaAnalyzer:
                     # Check if WHERE columns match PK
                     misaligned = [col for col, _ in most_common if col not in pk]
                     if misaligned:
-                        recommendations.append({
+                        yield {
                             'category': 'Query Patterns',
                             'table': table_name,
                             'recommendation': f"Align table design with query patterns",
                             'details': f"Columns frequently used in WHERE clauses ({', '.join(misaligned)}) are not part of the primary key",
                             'suggested_fix': self._generate_query_suggestion(table_name, misaligned, pk)
-                        })
-        
-        # 5. Many-to-Many Relationship Recommendations
+                        }
+    
+    def _many_to_many_recommendations(self):
+        """Yield recommendations for replacing junction tables."""
         for m2m in self.analysis_results['relationships']['many_to_many']:
-            recommendations.append({
+            yield {
                 'category': 'Many-to-Many Relationships',
                 'table': m2m['junction_table'],
                 'recommendation': f"Replace junction table with duplicated data",
                 'details': f"Junction table '{m2m['junction_table']}' connects {', '.join(m2m['connected_tables'])}",
                 'suggested_fix': self._generate_m2m_suggestion(m2m['junction_table'], m2m['connected_tables'])
-            })
-        
-        # 6. Self-Reference Recommendations
+            }
+    
+    def _hierarchy_recommendations(self):
+        """Yield recommendations for restructuring self-referencing tables."""
         for self_ref in self.analysis_results['relationships']['self_references']:
-            recommendations.append({
+            yield {
                 'category': 'Hierarchical Data',
                 'table': self_ref['table'],
                 'recommendation': f"Restructure hierarchical data",
                 'details': f"Table '{self_ref['table']}' has a self-reference on column '{self_ref['column']}'",
                 'suggested_fix': self._generate_hierarchy_suggestion(self_ref['table'], self_ref['column'])
-            })
-        
-        self.recommendations = recommendations
+            }
 
     def _get_table_columns(self, table_name):
         """Get columns for a specific table."""
-        for table in self.tables:
-            if table['name'] == table_name:
-                return table.get('columns', [])
-        return []
+        return self.columns_by_table.get(table_name, [])
 
     def _generate_pk_suggestion(self, table_name):
         """Generate suggestion for improving primary key."""
         columns = self._get_table_columns(table_name)
-        pk = [c['name'] for c in columns if c.get('primary_key', False)]
+        pk = self.analysis_results['table_structure']['table_stats'][table_name]['primary_key']
         
         # If no primary key, suggest using UUID
         if not pk:
@@ -708,28 +1017,7 @@ class SchemaAnalyzer:
     
     def _generate_type_suggestion(self, col_type):
         """Generate suggestion for improving column data type."""
-        col_type = col_type.lower()
-        
-        if 'float' in col_type or 'real' in col_type:
-            return "Replace with 'decimal' or use scaled integers stored as 'bigint' for precise calculations"
-        elif 'decimal' in col_type:
-            # Extract precision and scale if available
-            match = re.search(r'decimal\((\d+),(\d+)\)', col_type)
-            if match:
-                precision, scale = match.groups()
-                multiplier = 10 ** int(scale)
-                return f"Convert to 'bigint' and multiply values by {multiplier} to preserve precision"
-            return "Convert to 'bigint' with appropriate scaling factor"
-        elif 'datetime' in col_type:
-            return "Use 'timestamp' type in Cassandra"
-        elif 'varchar' in col_type or 'char' in col_type:
-            return "Use 'text' type in Cassandra"
-        elif 'enum' in col_type:
-            return "Replace with 'text' type in Cassandra"
-        elif 'json' in col_type:
-            return "Use 'text' type and handle JSON serialization in application code"
-        else:
-            return f"Review if '{col_type}' has a direct Cassandra equivalent"
+        return type_suggestion(col_type)
 
     def _generate_denorm_suggestion(self, main_table, related_tables):
         """Generate suggestion for denormalizing related tables."""
@@ -739,11 +1027,9 @@ class SchemaAnalyzer:
         parts = []
         for rel_table in related_tables:
             # Get foreign keys between these tables
-            rel_cols = []
-            for rel in self.relationships:
-                if (rel['from_table'] == main_table and rel['to_table'] == rel_table) or \
-                   (rel['from_table'] == rel_table and rel['to_table'] == main_table):
-                    rel_cols.append(rel)
+            rel_cols = [r for r in self.rels_by_from.get(main_table, []) if r['to_table'] == rel_table]
+            if rel_table != main_table:
+                rel_cols.extend(r for r in self.rels_by_to.get(main_table, []) if r['from_table'] == rel_table)
             
             if rel_cols:
                 # This is a one-to-many relationship
@@ -752,9 +1038,8 @@ class SchemaAnalyzer:
                     if rel['from_table'] == main_table:
                         parts.append(f"Duplicate '{main_table}' data into '{rel_table}' to eliminate joins")
                     else:
-                        # Get columns from related table
-                        rel_columns = [c['name'] for c in self._get_table_columns(rel_table)]
-                        non_key_cols = [c for c in rel_columns if c != rel['from_column']]
+                        # Get columns from related table, by name
+                        non_key_cols = [c for c in self.column_by_name.get(rel_table, {}) if c != rel['from_column']]
                         
                         if len(non_key_cols) <= 3:  # Arbitrary threshold for embedding vs. collection
                             cols_str = ', '.join(non_key_cols)
@@ -773,7 +1058,8 @@ class SchemaAnalyzer:
             return "No specific query pattern optimizations needed"
             
         # If we have WHERE columns not in PK, suggest changing PK
-        non_pk_where = [c for c in where_cols if c not in pk]
+        pk_set = set(pk)
+        non_pk_where = [c for c in where_cols if c not in pk_set]
         if non_pk_where:
             primary_where = non_pk_where[0]  # Most frequently used WHERE column
             
@@ -801,23 +1087,19 @@ class SchemaAnalyzer:
         # Determine which side is "one" vs "many" based on query patterns
         if 'access_patterns' in self.analysis_results and not self.analysis_results['access_patterns'].get('no_queries_provided', False):
             # Look at WHERE conditions to guess which is the "one" side
-            where_counts = {}
-            for query in self.access_patterns:
-                tables = self._extract_tables_from_query(query)
+            where_counts = Counter()
+            for tables, conditions in self.parsed_queries:
                 if junction_table in tables and (table1 in tables or table2 in tables):
-                    conditions = self._extract_conditions_from_query(query)
-                    for condition in conditions:
-                        where_counts[condition] = where_counts.get(condition, 0) + 1
+                    where_counts.update(conditions)
             
             # Get foreign key columns
             fk_to_table1 = None
             fk_to_table2 = None
-            for rel in self.relationships:
-                if rel['from_table'] == junction_table:
-                    if rel['to_table'] == table1:
-                        fk_to_table1 = rel['from_column']
-                    elif rel['to_table'] == table2:
-                        fk_to_table2 = rel['from_column']
+            for rel in self.rels_by_from.get(junction_table, []):
+                if rel['to_table'] == table1:
+                    fk_to_table1 = rel['from_column']
+                elif rel['to_table'] == table2:
+                    fk_to_table2 = rel['from_column']
             
             # Check which foreign key is used more in WHERE
             if fk_to_table1 and fk_to_table2:
@@ -840,464 +1122,426 @@ class SchemaAnalyzer:
         if not self.analysis_results or not self.best_practices_score:
             print("No analysis results to report. Run analyze_schema() first.")
             return False
+        
+        if output_file in NULL_OUTPUTS:
+            print("Dry run: PDF generation skipped")
+            return True
             
+        # reportlab is only needed for PDF output, so it is imported here
         try:
-            doc = SimpleDocTemplate(output_file, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Add custom styles - CHECK FOR EXISTING STYLES FIRST
-            custom_styles = {
-                'Heading1': ParagraphStyle(name='Heading1', fontSize=18, spaceAfter=12),
-                'Heading2': ParagraphStyle(name='Heading2', fontSize=14, spaceAfter=8, spaceBefore=12),
-                'Heading3': ParagraphStyle(name='Heading3', fontSize=12, spaceAfter=6, spaceBefore=6),
-                'TableHeader': ParagraphStyle(name='TableHeader', fontSize=10, alignment=1, textColor=colors.white, backColor=colors.darkblue),
-                'Score': ParagraphStyle(name='Score', fontSize=16, spaceBefore=12, spaceAfter=12),
-                'Note': ParagraphStyle(name='Note', fontName='Helvetica-Oblique', fontSize=10, textColor=colors.gray)
-            }
-            
-            # Only add styles that don't already exist
-            for style_name, style in custom_styles.items():
-                if style_name not in styles:
-                    styles.add(style)
-                
-            # Title
-            elements.append(Paragraph("Cassandra Schema Optimization Report", styles['Heading1']))
-            elements.append(Spacer(1, 12))
-            
-            # Overall Score
-            overall_score = self.best_practices_score['overall']
-            score_text = f"Overall Schema Score: {overall_score:.1f}/100"
-            
-            if overall_score >= 80:
-                score_color = colors.green
-                assessment = "EXCELLENT: This schema is well-suited for Cassandra with minor optimizations needed."
-            elif overall_score >= 60:
-                score_color = colors.orange
-                assessment = "GOOD: This schema can work with Cassandra but needs moderate optimizations."
-            else:
-                score_color = colors.red
-                assessment = "NEEDS WORK: Significant optimizations required for effective Cassandra implementation."
-            
-            elements.append(Paragraph(score_text, ParagraphStyle('Score', fontSize=16, textColor=score_color, spaceBefore=12, spaceAfter=12)))
-            elements.append(Paragraph(assessment, styles['Normal']))
-            elements.append(Spacer(1, 12))
-            
-            # Executive Summary
-            elements.append(Paragraph("Executive Summary", styles['Heading2']))
-            
-            # Category scores
-            categories = self.best_practices_score['categories']
-            category_data = [["Category", "Score", "Assessment"]]
-            for cat_name, cat_data in categories.items():
-                score = cat_data['score']
-                
-                if score >= 80:
-                    assessment = "Excellent"
-                elif score >= 60:
-                    assessment = "Good"
-                elif score >= 40:
-                    assessment = "Fair"
-                else:
-                    assessment = "Poor"
-                
-                category_data.append([cat_name.replace('_', ' ').title(), f"{score:.1f}/100", assessment])
-            
-            category_table = Table(category_data, colWidths=[200, 100, 100])
-            category_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('ALIGN', (1, 1), (1, -1), 'CENTER'),
-                ('ALIGN', (2, 1), (2, -1), 'CENTER'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ]))
-            elements.append(category_table)
-            elements.append(Spacer(1, 12))
-            
-            # Generate score chart
-            elements.append(self._create_score_chart())
-            elements.append(Spacer(1, 12))
-            
-            # Schema Overview
-            elements.append(Paragraph("Schema Overview", styles['Heading2']))
-            
-            # Table counts
-            elements.append(Paragraph(f"Total Tables: {self.analysis_results['table_structure']['total_tables']}", styles['Normal']))
-            elements.append(Paragraph(f"Total Columns: {self.analysis_results['table_structure']['total_columns']}", styles['Normal']))
-            elements.append(Paragraph(f"Total Relationships: {self.analysis_results['relationships']['total_relationships']}", styles['Normal']))
-            
-            if 'access_patterns' in self.analysis_results and not self.analysis_results['access_patterns'].get('no_queries_provided', False):
-                elements.append(Paragraph(f"Query Patterns Analyzed: {self.analysis_results['access_patterns']['total_queries']}", styles['Normal']))
-            
-            elements.append(Spacer(1, 12))
-            
-            # Top Recommendations
-            elements.append(Paragraph("Top Recommendations", styles['Heading2']))
-            
-            # Group recommendations by category
-            rec_by_category = defaultdict(list)
-            for rec in self.recommendations:
-                rec_by_category[rec['category']].append(rec)
-            
-            # Add top 3 recommendations from each category
-            for category, recs in rec_by_category.items():
-                elements.append(Paragraph(f"{category} Recommendations", styles['Heading3']))
-                
-                rec_items = []
-                for i, rec in enumerate(recs[:3]):  # Limit to top 3
-                    rec_text = f"<b>{rec['table']}:</b> {rec['recommendation']}<br/>{rec['details']}<br/><i>Suggested solution:</i> {rec['suggested_fix']}"
-                    rec_items.append(ListItem(Paragraph(rec_text, styles['Normal'])))
-                
-                if rec_items:
-                    elements.append(ListFlowable(rec_items, bulletType='bullet', leftIndent=20))
-                else:
-                    elements.append(Paragraph("No specific recommendations for this category.", styles['Normal']))
-                
-                elements.append(Spacer(1, 8))
-            
-            # Page break before detailed analysis
-            elements.append(PageBreak())
-            
-            # Detailed Analysis
-            elements.append(Paragraph("Detailed Schema Analysis", styles['Heading2']))
-            
-            # 1. Table Structure Analysis
-            elements.append(Paragraph("Table Structure Analysis", styles['Heading3']))
-            
-            # Create table for problematic data types
-            problem_tables = []
-            for table_name, stats in self.analysis_results['table_structure']['table_stats'].items():
-                problems = stats['problematic_types']
-                if problems:
-                    for col_name, col_type, issue in problems:
-                        problem_tables.append([table_name, col_name, col_type, issue])
-            
-            if problem_tables:
-                elements.append(Paragraph("Tables with Problematic Data Types for Cassandra:", styles['Normal']))
-                
-                problem_data = [["Table", "Column", "Current Type", "Issue"]]
-                problem_data.extend(problem_tables)
-                
-                problem_table = Table(problem_data, colWidths=[100, 100, 100, 200])
-                problem_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('TOPPADDING', (0, 1), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
-                ]))
-                elements.append(problem_table)
-            else:
-                elements.append(Paragraph("No problematic data types found in the schema.", styles['Normal']))
-            
-            elements.append(Spacer(1, 12))
-            
-            # 2. Relationship Analysis
-            elements.append(Paragraph("Relationship Analysis", styles['Heading3']))
-            
-            # High connectivity tables
-            high_conn = self.analysis_results['relationships']['high_connectivity_tables']
-            if high_conn:
-                elements.append(Paragraph("Tables with High Connectivity (potential query complexity):", styles['Normal']))
-                
-                conn_data = [["Table", "Incoming Refs", "Outgoing Refs", "Total"]]
-                for table in high_conn:
-                    conn_data.append([
-                        table['table'],
-                        str(table['in_references']),
-                        str(table['out_references']),
-                        str(table['total_connections'])
-                    ])
-                
-                conn_table = Table(conn_data, colWidths=[150, 100, 100, 100])
-                conn_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-                    ('TOPPADDING', (0, 1), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
-                ]))
-                elements.append(conn_table)
-                elements.append(Spacer(1, 8))
-                
-                # Add note about high connectivity
-                elements.append(Paragraph("Note: Tables with high connectivity often represent good candidates for denormalization in Cassandra.", 
-                                         ParagraphStyle('Note', fontName='Helvetica-Oblique', fontSize=10, textColor=colors.gray)))
-            else:
-                elements.append(Paragraph("No tables with high connectivity found in the schema.", styles['Normal']))
-            
-            elements.append(Spacer(1, 12))
-            
-            # 3. Access Pattern Analysis
-            elements.append(Paragraph("Access Pattern Analysis", styles['Heading3']))
-            
-            if 'access_patterns' in self.analysis_results and not self.analysis_results['access_patterns'].get('no_queries_provided', False):
-                # Most queried tables
-                most_queried = self.analysis_results['access_patterns']['most_queried_tables']
-                elements.append(Paragraph("Most Frequently Queried Tables:", styles['Normal']))
-                
-                query_data = [["Table", "Query Count"]]
-                for table, count in most_queried:
-                    query_data.append([table, str(count)])
-                
-                query_table = Table(query_data, colWidths=[200, 100])
-                query_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('ALIGN', (1, 1), (1, -1), 'CENTER'),
-                    ('TOPPADDING', (0, 1), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
-                ]))
-                elements.append(query_table)
-                
-                elements.append(Spacer(1, 8))
-                
-                # Most common WHERE conditions
-                most_where = self.analysis_results['access_patterns']['most_common_where']
-                elements.append(Paragraph("Most Common WHERE Conditions:", styles['Normal']))
-                
-                where_data = [["Column", "Frequency"]]
-                for col, count in most_where:
-                    where_data.append([col, str(count)])
-                
-                where_table = Table(where_data, colWidths=[200, 100])
-                where_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('ALIGN', (1, 1), (1, -1), 'CENTER'),
-                    ('TOPPADDING', (0, 1), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
-                ]))
-                elements.append(where_table)
-                
-                # Add note about WHERE conditions
-                elements.append(Paragraph("Note: Columns frequently used in WHERE clauses should be considered for partition keys in Cassandra.", 
-                                         ParagraphStyle('Note', fontName='Helvetica-Oblique', fontSize=10, textColor=colors.gray)))
-            else:
-                elements.append(Paragraph("No query patterns provided for analysis.", styles['Normal']))
+            from reportlab.lib.pagesizes import letter
+            from reportlab.platypus import SimpleDocTemplate
+            from reportlab.platypus.doctemplate import LayoutError
+        except ImportError as e:
+            print(f"Error generating PDF report: {e}")
+            return False
+        
+        # Render into memory, then write the finished PDF with a single write
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        styles = report_stylesheet()
+        
+        # Layout and file errors are reported; anything else is a bug and propagates
+        try:
+            doc.build(list(itertools.chain(
+                self._pdf_summary_section(styles),
+                self._pdf_analysis_section(styles),
+                self._pdf_scorecard_section(styles)
+            )))
+            
+            with open(output_file, 'wb') as f:
+                f.write(buffer.getbuffer())
+        except (LayoutError, ValueError, OSError) as e:
+            print(f"Error generating PDF report: {e}")
+            return False
+        
+        print(f"PDF report generated successfully: {output_file}")
+        return True
             
-            # Page break before best practices
-            elements.append(PageBreak())
+    def _pdf_summary_section(self, styles):
+        """Yield the title, overall score, executive summary and top recommendations."""
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import Paragraph, Spacer, ListFlowable, ListItem
+        
+        normal_style = styles['Normal']
+        heading1_style = styles['Heading1']
+        heading2_style = styles['Heading2']
+        heading3_style = styles['Heading3']
+        
+        # Title
+        yield Paragraph("Cassandra Schema Optimization Report", heading1_style)
+        yield Spacer(1, 12)
+        
+        # Overall Score
+        overall_score = self.best_practices_score['overall']
+        score_text = f"Overall Schema Score: {overall_score:.1f}/100"
+        
+        band = score_band(overall_score)
+        score_color = colors.toColor(SCORE_COLORS[band])
+        assessment = OVERALL_ASSESSMENTS[band]
+        
+        yield Paragraph(score_text, ParagraphStyle('Score', fontSize=16, textColor=score_color, spaceBefore=12, spaceAfter=12))
+        yield Paragraph(assessment, normal_style)
+        yield Spacer(1, 12)
+        
+        # Executive Summary
+        yield Paragraph("Executive Summary", heading2_style)
+        
+        # Category scores
+        categories = self.best_practices_score['categories']
+        category_data = [["Category", "Score", "Assessment"]]
+        category_data.extend(
+            [cat_name.replace('_', ' ').title(), "%.1f/100" % cat_data['score'], SCORE_LABELS[score_band(cat_data['score'])]]
+            for cat_name, cat_data in categories.items()
+        )
+        
+        yield from self._chunked_tables(category_data, [200, 100, 100], [
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+            ('ALIGN', (2, 1), (2, -1), 'CENTER'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+        ])
+        yield Spacer(1, 12)
+        
+        # Generate score chart
+        yield self._create_score_chart()
+        yield Spacer(1, 12)
+        
+        # Schema Overview
+        yield Paragraph("Schema Overview", heading2_style)
+        
+        # Table counts
+        table_structure = self.analysis_results['table_structure']
+        access_patterns = self.analysis_results.get('access_patterns', {})
+        yield Paragraph(f"Total Tables: {table_structure['total_tables']}", normal_style)
+        yield Paragraph(f"Total Columns: {table_structure['total_columns']}", normal_style)
+        yield Paragraph(f"Total Relationships: {self.analysis_results['relationships']['total_relationships']}", normal_style)
+        
+        if access_patterns and not access_patterns.get('no_queries_provided', False):
+            yield Paragraph(f"Query Patterns Analyzed: {access_patterns['total_queries']}", normal_style)
+        
+        yield Spacer(1, 12)
+        
+        # Top Recommendations
+        yield Paragraph("Top Recommendations", heading2_style)
+        
+        # Add top 3 recommendations from each category. generate_recommendations
+        # emits each category as one contiguous run, so groupby yields every
+        # category once, in order, with at least one recommendation.
+        for category, recs in itertools.groupby(self.recommendations, key=itemgetter('category')):
+            yield Paragraph(f"{category} Recommendations", heading3_style)
+            
+            rec_items = [
+                ListItem(Paragraph(REC_TEMPLATE % (rec['table'], rec['recommendation'], rec['details'], rec['suggested_fix']), normal_style))
+                for rec in itertools.islice(recs, 3)  # Limit to top 3
+            ]
+            yield ListFlowable(rec_items, bulletType='bullet', leftIndent=20)
             
-            # Best Practices Scorecard
-            elements.append(Paragraph("Cassandra Best Practices Scorecard", styles['Heading2']))
+            yield Spacer(1, 8)
+
+    def _pdf_analysis_section(self, styles):
+        """Yield the detailed schema analysis: table structure, relationships and access patterns."""
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import Paragraph, Spacer, PageBreak
+        
+        normal_style = styles['Normal']
+        heading2_style = styles['Heading2']
+        heading3_style = styles['Heading3']
+        note_style = ParagraphStyle('Note', fontName='Helvetica-Oblique', fontSize=10, textColor=colors.gray)
+        
+        # Page break before detailed analysis
+        yield PageBreak()
+        
+        # Detailed Analysis
+        yield Paragraph("Detailed Schema Analysis", heading2_style)
+        
+        # 1. Table Structure Analysis
+        yield Paragraph("Table Structure Analysis", heading3_style)
+        
+        # Create table for problematic data types
+        problem_tables = [
+            [table_name, col_name, col_type, issue]
+            for table_name, stats in self.analysis_results['table_structure']['table_stats'].items()
+            for col_name, col_type, issue in stats['problematic_types']
+        ]
+        
+        if problem_tables:
+            yield Paragraph("Tables with Problematic Data Types for Cassandra:", normal_style)
             
-            # 1. Primary Keys
-            elements.append(Paragraph("Primary Key Design", styles['Heading3']))
-            pk_score = self.best_practices_score['categories']['primary_keys']['score']
-            elements.append(Paragraph(f"Score: {pk_score:.1f}/100", styles['Normal']))
+            problem_data = [["Table", "Column", "Current Type", "Issue"]]
+            problem_data.extend(problem_tables)
             
-            # Primary key table
-            pk_data = [["Table", "Primary Key Structure", "Score", "Issues"]]
-            for detail in self.best_practices_score['categories']['primary_keys']['details']:
-                pk_data.append([
-                    detail['table'],
-                    ", ".join(self.analysis_results['table_structure']['table_stats'][detail['table']]['primary_key']),
-                    f"{detail['score']:.0f}/100",
-                    "; ".join(detail['issues'])
+            yield from self._chunked_tables(problem_data, [100, 100, 100, 200], COMPACT_ROW_STYLE)
+        else:
+            yield Paragraph("No problematic data types found in the schema.", normal_style)
+        
+        yield Spacer(1, 12)
+        
+        # 2. Relationship Analysis
+        yield Paragraph("Relationship Analysis", heading3_style)
+        
+        # High connectivity tables
+        high_conn = self.analysis_results['relationships']['high_connectivity_tables']
+        if high_conn:
+            yield Paragraph("Tables with High Connectivity (potential query complexity):", normal_style)
+            
+            conn_data = [["Table", "Incoming Refs", "Outgoing Refs", "Total"]]
+            for table in high_conn:
+                conn_data.append([
+                    table['table'],
+                    str(table['in_references']),
+                    str(table['out_references']),
+                    str(table['total_connections'])
                 ])
             
-            pk_table = Table(pk_data, colWidths=[100, 150, 50, 200])
-            pk_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('ALIGN', (2, 1), (2, -1), 'CENTER'),
-                ('TOPPADDING', (0, 1), (-1, -1), 3),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
-            ]))
-            elements.append(pk_table)
+            yield from self._chunked_tables(conn_data, [150, 100, 100, 100], COMPACT_ROW_STYLE + (
+                ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+            ))
+            yield Spacer(1, 8)
             
-            elements.append(Spacer(1, 8))
+            # Add note about high connectivity
+            yield Paragraph("Note: Tables with high connectivity often represent good candidates for denormalization in Cassandra.", note_style)
+        else:
+            yield Paragraph("No tables with high connectivity found in the schema.", normal_style)
+        
+        yield Spacer(1, 12)
+        
+        # 3. Access Pattern Analysis
+        yield Paragraph("Access Pattern Analysis", heading3_style)
+        
+        access_patterns = self.analysis_results.get('access_patterns', {})
+        if access_patterns and not access_patterns.get('no_queries_provided', False):
+            # Most queried tables
+            most_queried = access_patterns['most_queried_tables']
+            yield Paragraph("Most Frequently Queried Tables:", normal_style)
             
-            elements.append(Paragraph("Cassandra Primary Key Best Practices:", styles['Normal']))
-            pk_items = [
-                ListItem(Paragraph("Partition keys should distribute data evenly across nodes", styles['Normal'])),
-                ListItem(Paragraph("Avoid high-cardinality partition keys to prevent hotspots", styles['Normal'])),
-                ListItem(Paragraph("Use composite keys (partition key + clustering columns) for efficient data retrieval", styles['Normal'])),
-                ListItem(Paragraph("Order clustering columns based on query patterns", styles['Normal'])),
-                ListItem(Paragraph("Keep related data in the same partition to minimize reads", styles['Normal']))
-            ]
-            elements.append(ListFlowable(pk_items, bulletType='bullet', leftIndent=20))
+            query_data = [["Table", "Query Count"]]
+            for table, count in most_queried:
+                query_data.append([table, str(count)])
             
-            elements.append(Spacer(1, 12))
+            yield from self._chunked_tables(query_data, [200, 100], COMPACT_ROW_STYLE + (
+                ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+            ))
             
-            # 2. Data Types
-            elements.append(Paragraph("Data Type Selection", styles['Heading3']))
-            dt_score = self.best_practices_score['categories']['data_types']['score']
-            elements.append(Paragraph(f"Score: {dt_score:.1f}/100", styles['Normal']))
+            yield Spacer(1, 8)
             
-            elements.append(Paragraph("Cassandra Data Type Best Practices:", styles['Normal']))
-            dt_items = [
-                ListItem(Paragraph("Use text instead of varchar for string data", styles['Normal'])),
-                ListItem(Paragraph("Prefer bigint over decimal for numeric values requiring precision", styles['Normal'])),
-                ListItem(Paragraph("Use collections (list, set, map) for small groups of related data", styles['Normal'])),
-                ListItem(Paragraph("Use UUID type for globally unique identifiers", styles['Normal'])),
-                ListItem(Paragraph("Avoid using floating-point types for exact calculations", styles['Normal']))
-            ]
-            elements.append(ListFlowable(dt_items, bulletType='bullet', leftIndent=20))
+            # Most common WHERE conditions
+            most_where = access_patterns['most_common_where']
+            yield Paragraph("Most Common WHERE Conditions:", normal_style)
             
-            elements.append(Spacer(1, 12))
+            where_data = [["Column", "Frequency"]]
+            for col, count in most_where:
+                where_data.append([col, str(count)])
             
-            # 3. Denormalization Strategies
-            elements.append(Paragraph("Denormalization Strategies", styles['Heading3']))
-            denorm_score = self.best_practices_score['categories']['denormalization']['score']
-            elements.append(Paragraph(f"Score: {denorm_score:.1f}/100", styles['Normal']))
+            yield from self._chunked_tables(where_data, [200, 100], COMPACT_ROW_STYLE + (
+                ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+            ))
             
-            elements.append(Paragraph("Cassandra Denormalization Best Practices:", styles['Normal']))
-            denorm_items = [
-                ListItem(Paragraph("Design tables around query patterns, not entity relationships", styles['Normal'])),
-                ListItem(Paragraph("Duplicate data across tables to minimize joins", styles['Normal'])),
-                ListItem(Paragraph("Use collections for one-to-few relationships", styles['Normal'])),
-                ListItem(Paragraph("Create separate tables for each query pattern", styles['Normal'])),
-                ListItem(Paragraph("Accept data duplication to optimize read performance", styles['Normal']))
+            # Add note about WHERE conditions
+            yield Paragraph("Note: Columns frequently used in WHERE clauses should be considered for partition keys in Cassandra.", note_style)
+        else:
+            yield Paragraph("No query patterns provided for analysis.", normal_style)
+
+    def _pdf_scorecard_section(self, styles):
+        """Yield the Cassandra best practices scorecard."""
+        from reportlab.platypus import Paragraph, Spacer, PageBreak, ListFlowable, ListItem
+        
+        normal_style = styles['Normal']
+        heading2_style = styles['Heading2']
+        heading3_style = styles['Heading3']
+        
+        # Page break before best practices
+        yield PageBreak()
+        
+        # Best Practices Scorecard
+        yield Paragraph("Cassandra Best Practices Scorecard", heading2_style)
+        
+        categories = self.best_practices_score['categories']
+        
+        # 1. Primary Keys
+        yield Paragraph("Primary Key Design", heading3_style)
+        pk_category = categories['primary_keys']
+        pk_score = pk_category['score']
+        yield Paragraph(f"Score: {pk_score:.1f}/100", normal_style)
+        
+        # Primary key table
+        table_stats = self.analysis_results['table_structure']['table_stats']
+        pk_data = [["Table", "Primary Key Structure", "Score", "Issues"]]
+        pk_data.extend(
+            [
+                detail['table'],
+                ", ".join(table_stats[detail['table']]['primary_key']),
+                f"{detail['score']:.0f}/100",
+                "; ".join(detail['issues'])
             ]
-            elements.append(ListFlowable(denorm_items, bulletType='bullet', leftIndent=20))
-            
-            # Add top denormalization recommendations
-            denorm_recs = [r for r in self.recommendations if r['category'] == 'Denormalization']
-            if denorm_recs:
-                elements.append(Paragraph("Top Denormalization Recommendations:", styles['Normal']))
-                
-                rec_items = []
-                for i, rec in enumerate(denorm_recs[:3]):  # Limit to top 3
-                    rec_text = f"<b>{rec['table']}:</b> {rec['recommendation']}<br/>{rec['suggested_fix']}"
-                    rec_items.append(ListItem(Paragraph(rec_text, styles['Normal'])))
-                
-                elements.append(ListFlowable(rec_items, bulletType='bullet', leftIndent=20))
-            
-            elements.append(Spacer(1, 12))
-            
-            # 4. Query Patterns
-            elements.append(Paragraph("Query Pattern Alignment", styles['Heading3']))
-            query_score = self.best_practices_score['categories']['query_patterns']['score']
-            elements.append(Paragraph(f"Score: {query_score:.1f}/100", styles['Normal']))
-            
-            elements.append(Paragraph("Cassandra Query Pattern Best Practices:", styles['Normal']))
-            query_items = [
-                ListItem(Paragraph("Design tables based on specific query requirements", styles['Normal'])),
-                ListItem(Paragraph("Include all filtering columns in primary key", styles['Normal'])),
-                ListItem(Paragraph("Order clustering columns based on sorting needs", styles['Normal'])),
-                ListItem(Paragraph("Create separate tables for different access patterns", styles['Normal'])),
-                ListItem(Paragraph("Avoid secondary indexes except for low-cardinality columns", styles['Normal']))
+            for detail in pk_category['details']
+        )
+        
+        yield from self._chunked_tables(pk_data, [100, 150, 50, 200], COMPACT_ROW_STYLE + (
+            ('ALIGN', (2, 1), (2, -1), 'CENTER'),
+        ))
+        
+        yield Spacer(1, 8)
+        
+        yield Paragraph("Cassandra Primary Key Best Practices:", normal_style)
+        yield self._bullet_list(PK_BEST_PRACTICES, normal_style)
+        
+        yield Spacer(1, 12)
+        
+        # 2. Data Types
+        yield Paragraph("Data Type Selection", heading3_style)
+        dt_score = categories['data_types']['score']
+        yield Paragraph(f"Score: {dt_score:.1f}/100", normal_style)
+        
+        yield Paragraph("Cassandra Data Type Best Practices:", normal_style)
+        yield self._bullet_list(DATA_TYPE_BEST_PRACTICES, normal_style)
+        
+        yield Spacer(1, 12)
+        
+        # 3. Denormalization Strategies
+        yield Paragraph("Denormalization Strategies", heading3_style)
+        denorm_score = categories['denormalization']['score']
+        yield Paragraph(f"Score: {denorm_score:.1f}/100", normal_style)
+        
+        yield Paragraph("Cassandra Denormalization Best Practices:", normal_style)
+        yield self._bullet_list(DENORMALIZATION_BEST_PRACTICES, normal_style)
+        
+        # Add top denormalization recommendations
+        denorm_recs = list(itertools.islice((r for r in self.recommendations if r['category'] == 'Denormalization'), 3))
+        if denorm_recs:
+            yield Paragraph("Top Denormalization Recommendations:", normal_style)
+            
+            rec_items = [
+                ListItem(Paragraph(SHORT_REC_TEMPLATE % (rec['table'], rec['recommendation'], rec['suggested_fix']), normal_style))
+                for rec in denorm_recs
             ]
-            elements.append(ListFlowable(query_items, bulletType='bullet', leftIndent=20))
-            
-            # Build the document
-            doc.build(elements)
-            
-            print(f"PDF report generated successfully: {output_file}")
-            return True
-        except Exception as e:
-            print(f"Error generating PDF report: {e}")
-            return False
             
-    def _create_score_chart(self):
-        """Create a chart showing scores by category."""
-        drawing = Drawing(400, 200)
+            yield ListFlowable(rec_items, bulletType='bullet', leftIndent=20)
         
-        data = [
-            [self.best_practices_score['categories']['primary_keys']['score'],
-             self.best_practices_score['categories']['data_types']['score'],
-             self.best_practices_score['categories']['denormalization']['score'],
-             self.best_practices_score['categories']['query_patterns']['score']]
-        ]
+        yield Spacer(1, 12)
         
-        # Create and customize the bar chart
-        chart = VerticalBarChart()
-        chart.x = 50
-        chart.y = 50
-        chart.height = 125
-        chart.width = 300
-        chart.data = data
-        chart.valueAxis.valueMin = 0
-        chart.valueAxis.valueMax = 100
-        chart.valueAxis.valueStep = 20
-        chart.categoryAxis.labels.boxAnchor = 'ne'
-        chart.categoryAxis.labels.dx = -8
-        chart.categoryAxis.labels.dy = -2
-        chart.categoryAxis.labels.angle = 30
-        chart.categoryAxis.labels.fontName = 'Helvetica'
-        chart.categoryAxis.categoryNames = ['Primary Keys', 'Data Types', 'Denormalization', 'Query Patterns']
-        
-        # Set bar colors
-        chart.bars[0].fillColor = colors.steelblue
-        
-        drawing.add(chart)
-        return drawing
-
-def main():
-    parser = argparse.ArgumentParser(description='Analyze relational schema and generate Cassandra best practices report')
-    parser.add_argument('--schema', '-s', required=True, help='Input schema JSON file')
-    parser.add_argument('--queries', '-q', help='File containing common query patterns (optional)')
-    parser.add_argument('--output', '-o', required=True, help='Output PDF report file')
+        # 4. Query Patterns
+        yield Paragraph("Query Pattern Alignment", heading3_style)
+        query_score = categories['query_patterns']['score']
+        yield Paragraph(f"Score: {query_score:.1f}/100", normal_style)
+        
+        yield Paragraph("Cassandra Query Pattern Best Practices:", normal_style)
+        yield self._bullet_list(QUERY_PATTERN_BEST_PRACTICES, normal_style)
     
-    args = parser.parse_args()
+    def _bullet_list(self, texts, style):
+        """Build a bulleted ListFlowable with one paragraph per text."""
+        from reportlab.platypus import Paragraph, ListFlowable, ListItem
+        
+        return ListFlowable([ListItem(Paragraph(text, style)) for text in texts], bulletType='bullet', leftIndent=20)
+    
+    def _chunked_tables(self, data, col_widths, extra_style=()):
+        """
+        Build styled Tables of at most TABLE_CHUNK_ROWS rows from header + rows
+        data, repeating the header in each, so reportlab lays out many small
+        tables instead of one large one.
+        """
+        from reportlab.platypus import Spacer, Table, TableStyle
+        
+        style = TableStyle(HEADER_TABLE_STYLE + tuple(extra_style))
+        header, rows = data[0], data[1:]
+        flowables = []
+        for start in range(0, max(len(rows), 1), TABLE_CHUNK_ROWS):
+            if flowables:
+                flowables.append(Spacer(1, 6))
+            table = Table([header] + rows[start:start + TABLE_CHUNK_ROWS], colWidths=col_widths)
+            table.setStyle(style)
+            flowables.append(table)
+        return flowables
     
+    def _create_score_chart(self):
+        """Create a chart showing scores by category."""
+        categories = self.best_practices_score['categories']
+        return score_chart(tuple(categories[key]['score'] for key in SCORE_CATEGORY_KEYS))
+
+def generate_report(schema_file, queries_file, output_file, use_cache=True):
+    """Analyze one schema and write its PDF report. Returns a process exit code."""
     analyzer = SchemaAnalyzer()
     
+    # The report is fully determined by its inputs, so reuse a cached copy when available
+    # Dry runs write no report, so there is nothing to cache
+    use_cache = use_cache and output_file not in NULL_OUTPUTS
+    cache_file = analyzer.get_report_cache_file(schema_file, queries_file) if use_cache else None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            shutil.copyfile(cache_file, output_file)
+            print(f"Using cached report from {cache_file}")
+            print(f"- PDF report saved to: {output_file}")
+            return 0
+        except Exception as e:
+            print(f"Ignoring unreadable cache file {cache_file}: {e}")
+    
     # Load schema
-    if not analyzer.load_schema(args.schema):
+    if not analyzer.load_schema(schema_file):
         return 1
     
     # Load queries if provided
-    if args.queries:
-        analyzer.load_queries(args.queries)
+    if queries_file:
+        analyzer.load_queries(queries_file)
     
     # Analyze schema
     if not analyzer.analyze_schema():
         return 1
     
     # Generate PDF report
-    if not analyzer.generate_pdf_report(args.output):
+    if not analyzer.generate_pdf_report(output_file):
         return 1
     
+    if cache_file:
+        analyzer.save_cached_report(output_file, cache_file)
+    
     print(f"\nAnalysis complete!")
-    print(f"- PDF report saved to: {args.output}")
+    print(f"- PDF report saved to: {output_file}")
     
     return 0
 
+def _generate_report_task(task):
+    """ProcessPoolExecutor entry point: unpack a (schema, queries, output, use_cache) task."""
+    return generate_report(*task)
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze relational schema and generate Cassandra best practices report')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--schema', '-s', help='Input schema JSON file')
+    source.add_argument('--input-dir', help='Directory of schema JSON files to analyze in parallel')
+    parser.add_argument('--queries', '-q', help='File containing common query patterns (optional)')
+    parser.add_argument('--output', '-o', required=True, help='Output PDF report file (output directory with --input-dir)')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-run the analysis instead of using a cached report')
+    
+    args = parser.parse_args()
+    
+    if not args.input_dir:
+        return generate_report(args.schema, args.queries, args.output, not args.no_cache)
+    
+    # Batch mode: one report per schema, each built by a fresh analyzer in its own process
+    schema_files = sorted(glob.glob(os.path.join(args.input_dir, '*.json')))
+    if not schema_files:
+        print(f"No schema JSON files found in {args.input_dir}")
+        return 1
+    os.makedirs(args.output, exist_ok=True)
+    tasks = [
+        (schema_file, args.queries,
+         os.path.join(args.output, os.path.splitext(os.path.basename(schema_file))[0] + '.pdf'),
+         not args.no_cache)
+        for schema_file in schema_files
+    ]
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_generate_report_task, tasks))
+    
+    failed = [task[0] for task, result in zip(tasks, results) if result != 0]
+    print(f"\nGenerated {len(tasks) - len(failed)} of {len(tasks)} reports in {args.output}")
+    for schema_file in failed:
+        print(f"- Failed: {schema_file}")
+    
+    return 1 if failed else 0
+
 if __name__ == "__main__":
     exit(main())